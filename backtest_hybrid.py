@@ -15,6 +15,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from indicators import detect_order_block, detect_fvg, detect_liquidity_pool
+from trend_analyzer import TrendFollowingAnalyzer
 
 
 @dataclass
@@ -55,18 +56,6 @@ class HybridBacktester:
         self.trades: List[BacktestTrade] = []
         self.capital = initial_capital
     
-    def calculate_rsi(self, df: pd.DataFrame, period: int = 14) -> pd.Series:
-        """RSI 계산"""
-        delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
-    
-    def calculate_ema(self, df: pd.DataFrame, period: int) -> pd.Series:
-        """EMA 계산"""
-        return df['close'].ewm(span=period, adjust=False).mean()
-    
     def simulate_ict_trade(self, df: pd.DataFrame, symbol: str) -> List[BacktestTrade]:
         """ICT 거래 시뮬레이션 (1시간봉)"""
         trades = []
@@ -161,35 +150,19 @@ class HybridBacktester:
         take_profit = 0.3
         stop_loss = 0.5
         
-        # 지표 계산
-        df = df.copy()
-        df['rsi'] = self.calculate_rsi(df, 14)
-        df['ema_fast'] = self.calculate_ema(df, 12)
-        df['ema_slow'] = self.calculate_ema(df, 26)
+        # 봉별 진입 신호 일괄 계산 (골든크로스 또는 EMA 정배열 + 30 < RSI < 50)
+        actions, _ = TrendFollowingAnalyzer().analyze_vectorized(df)
+        closes = df['close'].to_numpy()
         
         i = 30
         while i < len(df) - 1:
-            if pd.isna(df['rsi'].iloc[i]):
-                i += 1
-                continue
-            
-            current_rsi = df['rsi'].iloc[i]
-            ema_fast = df['ema_fast'].iloc[i]
-            ema_slow = df['ema_slow'].iloc[i]
-            prev_ema_fast = df['ema_fast'].iloc[i-1]
-            prev_ema_slow = df['ema_slow'].iloc[i-1]
-            
-            # 골든크로스 + RSI < 50
-            golden_cross = (prev_ema_fast <= prev_ema_slow) and (ema_fast > ema_slow)
-            bullish = ema_fast > ema_slow and current_rsi < 50 and current_rsi > 30
-            
-            if golden_cross or bullish:
-                entry_price = df.iloc[i]['close']
+            if actions[i] == 1:
+                entry_price = closes[i]
                 entry_time = str(df.index[i])
                 
                 # 익절/손절 시뮬레이션 (5분 타임아웃)
                 for j in range(i + 1, min(i + 12, len(df))):  # 최대 1시간 (12 * 5분)
-                    current = df.iloc[j]['close']
+                    current = closes[j]
                     profit = ((current - entry_price) / entry_price) * 100
                     
                     if profit >= take_profit:
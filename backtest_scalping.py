@@ -7,6 +7,7 @@ Note: 실제 오더북 히스토리는 제공되지 않으므로
 """
 import pyupbit
 import pandas as pd
+from collections import deque
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from typing import List, Optional
@@ -49,27 +50,44 @@ class OrderbookScalpingBacktest:
         self.in_position = False
         self.entry_price = 0.0
         self.entry_time = None
+        
+        # 신호 계산용 컬럼 배열 (df가 바뀔 때만 다시 추출)
+        self._cols_df: Optional[pd.DataFrame] = None
+        self._opens = self._closes = self._volumes = None
+    
+    def _columns(self, df: pd.DataFrame):
+        """df의 시가/종가/거래량 배열 (같은 df면 재사용)"""
+        if df is not self._cols_df:
+            self._cols_df = df
+            self._opens = df['open'].to_numpy()
+            self._closes = df['close'].to_numpy()
+            self._volumes = df['volume'].to_numpy()
+        return self._opens, self._closes, self._volumes
     
-    def simulate_orderbook_signal(self, df: pd.DataFrame, idx: int) -> bool:
+    def simulate_orderbook_signal(self, df: pd.DataFrame, idx: int, avg_volume: float = None) -> bool:
         """
         오더북 매수 신호 시뮬레이션
         
         실제 오더북 데이터가 없으므로, 다음 조건으로 시뮬레이션:
         - 거래량이 평균의 1.5배 이상
         - 직전 캔들이 양봉 (매수 우세 추정)
+        
+        Args:
+            avg_volume: 직전 20봉 평균 거래량 (미지정 시 직접 계산)
         """
         if idx < 20:
             return False
         
-        current = df.iloc[idx]
-        prev = df.iloc[idx - 1]
+        # 행(Series) 생성 없이 배열에서 스칼라로 조회
+        opens, closes, volumes = self._columns(df)
         
         # 평균 거래량 대비 현재 거래량
-        avg_volume = df['volume'].iloc[idx-20:idx].mean()
-        volume_ratio = current['volume'] / avg_volume if avg_volume > 0 else 0
+        if avg_volume is None:
+            avg_volume = df['volume'].iloc[idx-20:idx].mean()
+        volume_ratio = volumes[idx] / avg_volume if avg_volume > 0 else 0
         
         # 시뮬레이션 조건: 거래량 급증 + 양봉
-        is_bullish = current['close'] > current['open']
+        is_bullish = closes[idx] > opens[idx]
         is_volume_spike = volume_ratio >= 1.5
         
         return is_bullish and is_volume_spike
@@ -79,10 +97,18 @@ class OrderbookScalpingBacktest:
         self.trades = []
         self.in_position = False
         
+        # 직전 20봉 거래량 합계 (봉마다 O(1) 갱신)
+        _, closes, volumes = self._columns(df)
+        vol_window = deque(maxlen=20)
+        vol_sum = 0.0
+        
+        # 봉마다 df.iloc 행을 만들지 않도록 종가/시간/신호 함수를 루프 밖에서 준비
+        times = df.index.to_list()
+        signal_at = self.simulate_orderbook_signal
+        
         for idx in range(len(df)):
-            current = df.iloc[idx]
-            current_price = current['close']
-            current_time = current.name
+            current_price = closes[idx]
+            current_time = times[idx]
             
             if self.in_position:
                 # 포지션 보유 중 - 익절/손절 체크
@@ -96,8 +122,15 @@ class OrderbookScalpingBacktest:
                     self._close_position(current_time, current_price, profit_rate, "손절")
             else:
                 # 포지션 없음 - 진입 조건 체크
-                if self.simulate_orderbook_signal(df, idx):
+                avg_volume = vol_sum / len(vol_window) if vol_window else 0.0
+                if signal_at(df, idx, avg_volume):
                     self._open_position(current_time, current_price)
+            
+            # 현재 봉 거래량을 윈도우에 반영
+            if len(vol_window) == vol_window.maxlen:
+                vol_sum -= vol_window[0]
+            vol_window.append(volumes[idx])
+            vol_sum += volumes[idx]
         
         # 마지막 포지션 청산 (백테스트 종료)
         if self.in_position:
@@ -2,6 +2,7 @@
 CryptoBot Studio - OHLCV Cache
 API 호출 최적화를 위한 캐싱 시스템
 """
+import threading
 import time
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, field
@@ -16,6 +17,10 @@ class CacheEntry:
     data: Any
     timestamp: float
     ttl: float  # Time To Live (seconds)
+    open_bar: bool = False  # 마지막 봉이 아직 진행 중 (bar_aligned 보관 항목)
+    bar_refreshed: float = 0.0  # 진행 중인 봉을 마지막으로 재조회한 시각
+    live_high: Optional[float] = None  # 진행 중인 봉의 재조회 이후 최고/최저 현재가
+    live_low: Optional[float] = None
     
     def is_expired(self) -> bool:
         """만료 여부 확인"""
@@ -28,8 +33,17 @@ class OHLCVCache:
     
     API 호출 횟수를 줄이고 응답 속도를 개선합니다.
     동일한 심볼/인터벌에 대해 TTL 내 재요청 시 캐시된 데이터 반환.
+    bar_aligned 요청은 마지막 봉이 닫힐 때까지 보관합니다 (새 봉이 생길 때만 전체 재조회).
+    이 경우 진행 중인 마지막 봉은 TTL마다 캔들 1개만 재조회해 거래소 고가/저가/거래량으로
+    교체하고, live_price로 종가/고가/저가를 갱신한 사본을 반환합니다.
     """
     
+    # 분봉 인터벌 길이 (초) - bar_aligned 만료 시각 계산용
+    _INTERVAL_SECONDS = {
+        "minute1": 60, "minute3": 180, "minute5": 300, "minute10": 600,
+        "minute15": 900, "minute30": 1800, "minute60": 3600, "minute240": 14400,
+    }
+    
     def __init__(self, default_ttl: float = 60.0):
         """
         Args:
@@ -40,18 +54,20 @@ class OHLCVCache:
         self._hit_count = 0
         self._miss_count = 0
         
-        logger.debug(f"📦 OHLCV Cache 초기화 (TTL: {default_ttl}초)")
+        logger.debug("📦 OHLCV Cache 초기화 (TTL: {}초)", default_ttl)
     
-    def _make_key(self, symbol: str, interval: str) -> str:
-        """캐시 키 생성"""
-        return f"{symbol}_{interval}"
+    def _make_key(self, symbol: str, interval: str, count: int, bar_aligned: bool) -> str:
+        """캐시 키 생성 (개수/보관 방식이 다른 요청은 따로 보관)"""
+        return f"{symbol}_{interval}_{count}_{'bar' if bar_aligned else 'ttl'}"
     
     def get(
         self,
         symbol: str,
         interval: str = "minute60",
         count: int = 200,
-        ttl: float = None
+        ttl: float = None,
+        bar_aligned: bool = False,
+        live_price: Optional[float] = None
     ) -> Optional[Any]:
         """
         OHLCV 데이터 조회 (캐시 우선)
@@ -61,42 +77,117 @@ class OHLCVCache:
             interval: 시간 간격
             count: 캔들 개수
             ttl: 이 요청의 TTL (없으면 default_ttl 사용)
+            bar_aligned: True면 마지막 봉 마감 시각까지 보관 (분봉 인터벌만, 그 외는 ttl)
+            live_price: 현재가 (bar_aligned 보관 중인 진행 봉의 종가/고가/저가에 반영)
             
         Returns:
             pandas DataFrame 또는 None
         """
-        key = self._make_key(symbol, interval)
+        key = self._make_key(symbol, interval, count, bar_aligned)
         ttl = ttl or self.default_ttl
         
         # 캐시 확인
         if key in self._cache:
             entry = self._cache[key]
-            if not entry.is_expired():
+            if not entry.is_expired() and (
+                not entry.open_bar
+                or time.time() - entry.bar_refreshed <= ttl
+                or self._refresh_open_bar(entry, symbol, interval)
+            ):
                 self._hit_count += 1
-                logger.debug(f"📦 Cache HIT: {key}")
-                return entry.data
+                logger.debug("📦 Cache HIT: {}", key)
+                return self._with_live_price(entry, live_price)
             else:
-                # 만료된 항목 삭제
+                # 만료된 항목(또는 새 봉이 시작된 항목) 삭제
                 del self._cache[key]
         
         # 캐시 미스 - API 호출
         self._miss_count += 1
-        logger.debug(f"📦 Cache MISS: {key}")
+        logger.debug("📦 Cache MISS: {}", key)
         
         try:
             data = pyupbit.get_ohlcv(symbol, interval=interval, count=count)
             if data is not None and len(data) > 0:
-                self._cache[key] = CacheEntry(
+                now = time.time()
+                until_close = self._until_bar_close(data, interval, now) if bar_aligned else None
+                entry = CacheEntry(
                     data=data,
-                    timestamp=time.time(),
-                    ttl=ttl
+                    timestamp=now,
+                    ttl=until_close or ttl,
+                    open_bar=until_close is not None,
+                    bar_refreshed=now
                 )
-                return data
+                self._cache[key] = entry
+                return self._with_live_price(entry, live_price)
             return None
         except Exception as e:
             logger.error(f"OHLCV 조회 실패 ({symbol}): {e}")
             return None
     
+    def _until_bar_close(self, data, interval: str, now: float) -> Optional[float]:
+        """마지막 봉 마감까지 남은 시간 (초, 계산 불가하거나 이미 지났으면 None)"""
+        seconds = self._INTERVAL_SECONDS.get(interval)
+        if seconds is None:
+            return None
+        
+        # pyupbit 인덱스는 KST 기준 봉 시작 시각 (tz 없음)
+        bar_open = data.index[-1]
+        if bar_open.tzinfo is None:
+            bar_open = bar_open.tz_localize("Asia/Seoul")
+        remaining = bar_open.timestamp() + seconds - now
+        return remaining if remaining > 0 else None
+    
+    def _refresh_open_bar(self, entry: CacheEntry, symbol: str, interval: str) -> bool:
+        """
+        진행 중인 마지막 봉만 재조회해 교체 (캔들 1개 - 폴링 사이의 꼬리까지 거래소 값 사용)
+        
+        이미 반환한 DataFrame은 바꾸지 않도록 사본에 교체해 보관합니다.
+        
+        Returns:
+            보관 항목 계속 사용 여부 (새 봉이 시작됐으면 False - 전체 재조회 필요)
+        """
+        try:
+            bar = pyupbit.get_ohlcv(symbol, interval=interval, count=1)
+        except Exception as e:
+            logger.warning(f"진행 봉 재조회 실패 ({symbol}): {e}")
+            return True
+        if bar is None or len(bar) == 0:
+            return True
+        
+        data = entry.data
+        if bar.index[-1] != data.index[-1]:
+            return False
+        
+        data = data.copy()
+        data.iloc[-1] = bar.iloc[-1][data.columns]
+        entry.data = data
+        entry.bar_refreshed = time.time()
+        entry.live_high = entry.live_low = None
+        return True
+    
+    @staticmethod
+    def _with_live_price(entry: CacheEntry, live_price: Optional[float]):
+        """
+        진행 중인 마지막 봉에 현재가 반영 (보관 중인 원본은 그대로 두고 사본 반환)
+        
+        고가/저가는 마지막 재조회 이후 받은 현재가의 최고/최저까지 누적합니다.
+        """
+        data = entry.data
+        if live_price is None or not entry.open_bar:
+            return data
+        
+        entry.live_high = live_price if entry.live_high is None else max(entry.live_high, live_price)
+        entry.live_low = live_price if entry.live_low is None else min(entry.live_low, live_price)
+        
+        data = data.copy()
+        columns = data.columns
+        data.iat[-1, columns.get_loc('close')] = live_price
+        high = columns.get_loc('high')
+        low = columns.get_loc('low')
+        data.iat[-1, high] = max(data.iat[-1, high], entry.live_high)
+        data.iat[-1, low] = min(data.iat[-1, low], entry.live_low)
+        return data
+    
     def invalidate(self, symbol: str = None, interval: str = None):
         """
         캐시 무효화
@@ -113,12 +204,13 @@ class OHLCVCache:
             keys_to_delete = [k for k in self._cache.keys() if k.startswith(f"{symbol}_")]
             for key in keys_to_delete:
                 del self._cache[key]
-            logger.debug(f"📦 Cache 삭제: {symbol} (모든 인터벌)")
+            logger.debug("📦 Cache 삭제: {} (모든 인터벌)", symbol)
         else:
-            key = self._make_key(symbol, interval)
-            if key in self._cache:
+            # 해당 심볼/인터벌의 모든 개수/보관 방식 삭제
+            prefix = f"{symbol}_{interval}_"
+            for key in [k for k in self._cache.keys() if k.startswith(prefix)]:
                 del self._cache[key]
-                logger.debug(f"📦 Cache 삭제: {key}")
+                logger.debug("📦 Cache 삭제: {}", key)
     
     def get_stats(self) -> Dict:
         """캐시 통계 조회"""
@@ -142,7 +234,7 @@ class OHLCVCache:
             del self._cache[key]
         
         if expired_keys:
-            logger.debug(f"📦 만료된 캐시 {len(expired_keys)}개 정리")
+            logger.debug("📦 만료된 캐시 {}개 정리", len(expired_keys))
 
 
 class RateLimiter:
@@ -161,24 +253,26 @@ class RateLimiter:
         self.min_interval = 1.0 / calls_per_second
         self._last_call_time = 0.0
         self._call_count = 0
+        self._lock = threading.Lock()  # 여러 스레드에서 동시에 호출 (AutoTrader 심볼별 병렬 조회)
         
-        logger.debug(f"⏱️ Rate Limiter 초기화 (초당 {calls_per_second}회)")
+        logger.debug("⏱️ Rate Limiter 초기화 (초당 {}회)", calls_per_second)
     
     def wait_if_needed(self):
         """
         필요시 대기
         
         마지막 호출 이후 충분한 시간이 지나지 않았으면 대기.
+        호출 시각은 잠금 안에서 예약하고 대기는 잠금 밖에서 하므로
+        동시 호출도 min_interval 간격으로 순서대로 나갑니다.
         """
-        now = time.time()
-        elapsed = now - self._last_call_time
-        
-        if elapsed < self.min_interval:
-            sleep_time = self.min_interval - elapsed
-            time.sleep(sleep_time)
+        with self._lock:
+            now = time.time()
+            call_time = max(now, self._last_call_time + self.min_interval)
+            self._last_call_time = call_time
+            self._call_count += 1
         
-        self._last_call_time = time.time()
-        self._call_count += 1
+        if call_time > now:
+            time.sleep(call_time - now)
     
     def get_stats(self) -> Dict:
         """통계 조회"""
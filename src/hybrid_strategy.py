@@ -3,7 +3,7 @@ CryptoBot Studio - Hybrid Strategy (ICT + Trend Following)
 고승률 ICT + 고빈도 추세추종 하이브리드 전략
 목표: 매일 1% 수익률 달성
 """
-from typing import Optional, Literal
+from typing import Optional, Literal, ClassVar
 from dataclasses import dataclass
 from datetime import datetime
 from loguru import logger
@@ -13,7 +13,7 @@ from trend_analyzer import TrendFollowingAnalyzer, TrendSignal
 from indicators import detect_order_block, detect_fvg, detect_liquidity_pool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HybridSignal:
     """하이브리드 신호"""
     action: str  # "BUY", "SELL", "HOLD"
@@ -45,6 +45,10 @@ class HybridStrategy:
     - 추세: 포트폴리오 1%, 익절 0.3%, 손절 0.5%
     """
     
+    # 고정 HOLD 신호 (불변 HybridSignal 재사용)
+    _HOLD_NO_PRICE: ClassVar[HybridSignal] = HybridSignal("HOLD", "NONE", 0.0, "현재가 정보 없음", 0, 0, 0)
+    _HOLD_NO_ENTRY: ClassVar[HybridSignal] = HybridSignal("HOLD", "NONE", 0.3, "진입 신호 없음", 0, 0, 0)
+    
     def __init__(
         self,
         daily_target: float = 1.0,  # 일일 목표 %
@@ -120,6 +124,7 @@ class HybridStrategy:
         in_position: bool = False,
         entry_price: float = None,
         position_strategy: str = None,  # 현재 포지션의 전략 타입
+        symbol: str = None,  # 종목 (ICT 지표 캐시 키)
         **kwargs
     ) -> HybridSignal:
         """
@@ -132,17 +137,10 @@ class HybridStrategy:
             in_position: 포지션 보유 여부
             entry_price: 진입가
             position_strategy: 포지션의 원래 전략 ("ICT" or "TREND")
+            symbol: 종목 코드
         """
         if current_price is None:
-            return HybridSignal(
-                action="HOLD",
-                strategy_type="NONE",
-                confidence=0.0,
-                reason="현재가 정보 없음",
-                position_size_ratio=0,
-                take_profit=0,
-                stop_loss=0
-            )
+            return self._HOLD_NO_PRICE
         
         size_mult = self.get_position_size_multiplier()
         
@@ -213,7 +211,8 @@ class HybridStrategy:
             ict_signal = self.ict_strategy.analyze(
                 ohlcv_df=df_1h,
                 current_price=current_price,
-                in_position=False
+                in_position=False,
+                symbol=symbol
             )
             
             if ict_signal.action == "BUY" and ict_signal.confidence >= 0.7:
@@ -252,15 +251,7 @@ class HybridStrategy:
                 )
         
         # 신호 없음
-        return HybridSignal(
-            action="HOLD",
-            strategy_type="NONE",
-            confidence=0.3,
-            reason="진입 신호 없음",
-            position_size_ratio=0,
-            take_profit=0,
-            stop_loss=0
-        )
+        return self._HOLD_NO_ENTRY
     
     def get_daily_stats(self) -> dict:
         """일일 통계 반환"""
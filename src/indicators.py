@@ -4,10 +4,13 @@ RSI, Bollinger Bands, and other technical analysis functions
 """
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Tuple, Optional
 from dataclasses import dataclass
 from loguru import logger
 
+from kernels import DIR_BULLISH, DIR_NONE, fvg_scan, macd_tail, order_block_scan, wilder_averages
+
 
 @dataclass
 class RSIResult:
@@ -115,26 +118,18 @@ def calculate_rsi(
         return None
     
     try:
-        # 가격 변화량
-        delta = prices.diff()
-        
-        # 상승/하락 분리
-        gain = delta.where(delta > 0, 0.0)
-        loss = (-delta).where(delta < 0, 0.0)
-        
-        # 평균 상승/하락 (Wilder's smoothing)
-        avg_gain = gain.ewm(alpha=1/period, min_periods=period, adjust=False).mean()
-        avg_loss = loss.ewm(alpha=1/period, min_periods=period, adjust=False).mean()
+        # 평균 상승/하락 (Wilder's smoothing, 마지막 봉 값만 계산)
+        close = prices.to_numpy(dtype=np.float64)
+        avg_gain, avg_loss = wilder_averages(close, period)
         
-        # RS 계산
-        rs = avg_gain / avg_loss
-        rs = rs.replace([np.inf, -np.inf], 0)
+        # RS 계산 (하락 없음 -> RS 0 처리, 변화 없음 -> NaN)
+        if avg_loss == 0:
+            rs = np.nan if avg_gain == 0 else 0.0
+        else:
+            rs = avg_gain / avg_loss
         
         # RSI 계산
-        rsi = 100 - (100 / (1 + rs))
-        
-        # 마지막 값
-        current_rsi = float(rsi.iloc[-1])
+        current_rsi = 100 - (100 / (1 + rs))
         
         return RSIResult(
             value=current_rsi,
@@ -179,10 +174,10 @@ def calculate_bollinger_bands(
         lower = middle - (std * std_dev)
         
         # 마지막 값들
-        current_price = float(prices.iloc[-1])
-        current_upper = float(upper.iloc[-1])
-        current_middle = float(middle.iloc[-1])
-        current_lower = float(lower.iloc[-1])
+        current_price = prices.iloc[-1]
+        current_upper = upper.iloc[-1]
+        current_middle = middle.iloc[-1]
+        current_lower = lower.iloc[-1]
         
         # %B 계산 (현재 가격이 밴드 내 어디에 위치하는지)
         band_width = current_upper - current_lower
@@ -218,7 +213,7 @@ def calculate_sma(prices: pd.Series, period: int) -> Optional[float]:
         return None
     
     try:
-        return float(prices.rolling(window=period).mean().iloc[-1])
+        return prices.rolling(window=period).mean().iloc[-1]
     except Exception as e:
         logger.error(f"SMA 계산 에러: {e}")
         return None
@@ -239,7 +234,7 @@ def calculate_ema(prices: pd.Series, period: int) -> Optional[float]:
         return None
     
     try:
-        return float(prices.ewm(span=period, adjust=False).mean().iloc[-1])
+        return prices.ewm(span=period, adjust=False).mean().iloc[-1]
     except Exception as e:
         logger.error(f"EMA 계산 에러: {e}")
         return None
@@ -267,30 +262,43 @@ def calculate_macd(
         return None
     
     try:
-        # EMAs
-        fast_ema = prices.ewm(span=fast_period, adjust=False).mean()
-        slow_ema = prices.ewm(span=slow_period, adjust=False).mean()
-        
-        # MACD Line
-        macd_line = fast_ema - slow_ema
-        
-        # Signal Line
-        signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
+        close = prices.to_numpy(dtype=np.float64)
+        
+        # MACD / Signal Line 마지막 값 (EMA 재귀식을 한 번에 진행 - 중간 배열 생성 생략)
+        macd, _, signal, _ = macd_tail(
+            close,
+            2.0 / (fast_period + 1),
+            2.0 / (slow_period + 1),
+            2.0 / (signal_period + 1)
+        )
         
         # Histogram
-        histogram = macd_line - signal_line
+        histogram = macd - signal
         
-        return (
-            float(macd_line.iloc[-1]),
-            float(signal_line.iloc[-1]),
-            float(histogram.iloc[-1])
-        )
+        return macd, signal, histogram
         
     except Exception as e:
         logger.error(f"MACD 계산 에러: {e}")
         return None
 
 
+def _ohlcv_arrays(
+    df: pd.DataFrame,
+    lookback: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    최근 lookback개 캔들의 (open, high, low, close) float64 배열
+    
+    탐지 루프에서 df.iloc 행 단위 접근(행마다 Series 생성) 대신 사용합니다.
+    """
+    return (
+        df['open'].to_numpy(dtype=np.float64)[-lookback:],
+        df['high'].to_numpy(dtype=np.float64)[-lookback:],
+        df['low'].to_numpy(dtype=np.float64)[-lookback:],
+        df['close'].to_numpy(dtype=np.float64)[-lookback:]
+    )
+
+
 def detect_fvg(
     df: pd.DataFrame,
     min_gap_percent: float = 0.1,
@@ -318,81 +326,41 @@ def detect_fvg(
         return None
     
     try:
-        # 최근 N개 캔들만 사용
-        df = df.tail(lookback).reset_index(drop=False)
+        # 최근 N개 캔들만 사용 (고가/저가 배열로 커널 1회 탐색)
+        df = df.tail(lookback)
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
         
         # 가장 최근의 미충전 FVG를 찾기 (뒤에서부터 탐색)
-        for i in range(len(df) - 1, 2, -1):
-            candle_n2 = df.iloc[i-2]  # 2개 전 캔들
-            candle_n1 = df.iloc[i-1]  # 모멘텀 캔들 (가장 긴 캔들)
-            candle_n = df.iloc[i]     # 현재 캔들
+        direction, i = fvg_scan(high, low, min_gap_percent)
+        
+        if direction != DIR_NONE:
+            # 모멘텀 캔들(i-1) 시간 정보 (이름 없는 인덱스만 - 기존 reset_index 'index' 컬럼과 동일)
+            time_str = str(df.index[i - 1]) if df.index.name is None else None
             
-            # 상승 FVG: N-2의 고가 < N의 저가 (갭 발생)
-            if candle_n2['high'] < candle_n['low']:
-                gap_bottom = candle_n2['high']
-                gap_top = candle_n['low']
-                gap_size = gap_top - gap_bottom
-                gap_percent = (gap_size / gap_bottom) * 100
-                
-                # 최소 갭 크기 체크
-                if gap_percent >= min_gap_percent:
-                    # 갭이 아직 충전되지 않았는지 확인 (최근 캔들들이 갭을 채우지 않음)
-                    filled = False
-                    for j in range(i + 1, len(df)):
-                        if df.iloc[j]['low'] <= gap_bottom:
-                            filled = True
-                            break
-                    
-                    if not filled:
-                        # 시간 정보
-                        time_str = None
-                        if 'index' in df.columns:
-                            time_str = str(candle_n1['index'])
-                        
-                        return FVGResult(
-                            found=True,
-                            direction="BULLISH",
-                            gap_top=gap_top,
-                            gap_bottom=gap_bottom,
-                            stop_loss=candle_n1['low'],
-                            take_profit=candle_n1['high'],
-                            momentum_candle_time=time_str,
-                            gap_size=gap_size,
-                            gap_percent=gap_percent
-                        )
+            if direction == DIR_BULLISH:
+                # 상승 FVG: N-2의 고가 < N의 저가
+                gap_top = low[i]
+                gap_bottom = high[i - 2]
+                stop_loss, take_profit = low[i - 1], high[i - 1]
+            else:
+                # 하락 FVG: N-2의 저가 > N의 고가
+                gap_top = low[i - 2]
+                gap_bottom = high[i]
+                stop_loss, take_profit = high[i - 1], low[i - 1]
             
-            # 하락 FVG: N-2의 저가 > N의 고가 (갭 발생)
-            if candle_n2['low'] > candle_n['high']:
-                gap_top = candle_n2['low']
-                gap_bottom = candle_n['high']
-                gap_size = gap_top - gap_bottom
-                gap_percent = (gap_size / gap_bottom) * 100
-                
-                # 최소 갭 크기 체크
-                if gap_percent >= min_gap_percent:
-                    # 갭이 아직 충전되지 않았는지 확인
-                    filled = False
-                    for j in range(i + 1, len(df)):
-                        if df.iloc[j]['high'] >= gap_top:
-                            filled = True
-                            break
-                    
-                    if not filled:
-                        time_str = None
-                        if 'index' in df.columns:
-                            time_str = str(candle_n1['index'])
-                        
-                        return FVGResult(
-                            found=True,
-                            direction="BEARISH",
-                            gap_top=gap_top,
-                            gap_bottom=gap_bottom,
-                            stop_loss=candle_n1['high'],
-                            take_profit=candle_n1['low'],
-                            momentum_candle_time=time_str,
-                            gap_size=gap_size,
-                            gap_percent=gap_percent
-                        )
+            gap_size = gap_top - gap_bottom
+            return FVGResult(
+                found=True,
+                direction="BULLISH" if direction == DIR_BULLISH else "BEARISH",
+                gap_top=gap_top,
+                gap_bottom=gap_bottom,
+                stop_loss=stop_loss,
+                take_profit=take_profit,
+                momentum_candle_time=time_str,
+                gap_size=gap_size,
+                gap_percent=(gap_size / gap_bottom) * 100
+            )
         
         # FVG 없음
         return FVGResult(
@@ -438,70 +406,34 @@ def detect_order_block(
         return None
     
     try:
-        df = df.tail(lookback).reset_index(drop=False)
+        opens, highs, lows, closes = _ohlcv_arrays(df, lookback)
         
         # 뒤에서부터 탐색 (최신 OB 찾기)
-        for i in range(len(df) - 1, min_consecutive + 1, -1):
-            # 최근 연속 상승/하락 체크
-            consecutive_up = 0
-            consecutive_down = 0
-            
-            for j in range(i, max(i - 5, 0), -1):
-                candle = df.iloc[j]
-                if candle['close'] > candle['open']:
-                    consecutive_up += 1
-                    consecutive_down = 0
-                else:
-                    consecutive_down += 1
-                    consecutive_up = 0
-                    
-                if consecutive_up >= min_consecutive or consecutive_down >= min_consecutive:
-                    break
-            
-            # Bullish OB: 연속 상승 직전의 마지막 음봉
-            if consecutive_up >= min_consecutive:
-                # OB 캔들 찾기 (상승 직전의 음봉)
-                ob_idx = i - consecutive_up
-                if ob_idx >= 0:
-                    ob_candle = df.iloc[ob_idx]
-                    if ob_candle['close'] < ob_candle['open']:  # 음봉 확인
-                        body = abs(ob_candle['close'] - ob_candle['open'])
-                        total_range = ob_candle['high'] - ob_candle['low']
-                        body_ratio = body / total_range if total_range > 0 else 0
-                        
-                        if body_ratio >= min_body_ratio:
-                            time_str = str(ob_candle['index']) if 'index' in df.columns else None
-                            return OrderBlockResult(
-                                found=True,
-                                direction="BULLISH",
-                                level=ob_candle['low'],
-                                zone_top=ob_candle['open'],
-                                zone_bottom=ob_candle['low'],
-                                strength=consecutive_up,
-                                candle_time=time_str
-                            )
-            
+        direction, ob_idx, strength = order_block_scan(opens, highs, lows, closes, min_consecutive, min_body_ratio)
+        
+        if direction != DIR_NONE:
+            candle_time = str(df.index[len(df) - lookback + ob_idx])
+            if direction == DIR_BULLISH:
+                # Bullish OB: 연속 상승 직전의 마지막 음봉
+                return OrderBlockResult(
+                    found=True,
+                    direction="BULLISH",
+                    level=lows[ob_idx],
+                    zone_top=opens[ob_idx],
+                    zone_bottom=lows[ob_idx],
+                    strength=strength,
+                    candle_time=candle_time
+                )
             # Bearish OB: 연속 하락 직전의 마지막 양봉
-            if consecutive_down >= min_consecutive:
-                ob_idx = i - consecutive_down
-                if ob_idx >= 0:
-                    ob_candle = df.iloc[ob_idx]
-                    if ob_candle['close'] > ob_candle['open']:  # 양봉 확인
-                        body = abs(ob_candle['close'] - ob_candle['open'])
-                        total_range = ob_candle['high'] - ob_candle['low']
-                        body_ratio = body / total_range if total_range > 0 else 0
-                        
-                        if body_ratio >= min_body_ratio:
-                            time_str = str(ob_candle['index']) if 'index' in df.columns else None
-                            return OrderBlockResult(
-                                found=True,
-                                direction="BEARISH",
-                                level=ob_candle['high'],
-                                zone_top=ob_candle['high'],
-                                zone_bottom=ob_candle['close'],
-                                strength=consecutive_down,
-                                candle_time=time_str
-                            )
+            return OrderBlockResult(
+                found=True,
+                direction="BEARISH",
+                level=highs[ob_idx],
+                zone_top=highs[ob_idx],
+                zone_bottom=closes[ob_idx],
+                strength=strength,
+                candle_time=candle_time
+            )
         
         # OB 없음
         return OrderBlockResult(
@@ -545,96 +477,54 @@ def detect_liquidity_pool(
         return None
     
     try:
-        df = df.tail(lookback).reset_index(drop=True)
-        
-        swing_highs = []
-        swing_lows = []
-        
-        # 스윙 포인트 탐지
-        for i in range(swing_period, len(df) - swing_period):
-            candle = df.iloc[i]
+        _, highs, lows, closes = _ohlcv_arrays(df, lookback)
+        
+        # 스윙 포인트 탐지 (좌우 swing_period개 창을 한 번에 비교)
+        swing_high_levels = swing_low_levels = np.empty(0)
+        window = 2 * swing_period + 1
+        if len(highs) >= window:
+            high_win = sliding_window_view(highs, window)
+            low_win = sliding_window_view(lows, window)
+            center_high = highs[swing_period:len(highs) - swing_period]
+            center_low = lows[swing_period:len(lows) - swing_period]
             
-            # Swing High 체크
-            is_swing_high = True
-            for j in range(i - swing_period, i + swing_period + 1):
-                if j != i and df.iloc[j]['high'] >= candle['high']:
-                    is_swing_high = False
-                    break
-            if is_swing_high:
-                swing_highs.append((i, candle['high']))
+            # Swing High: 좌우 모든 고가보다 높음 / Swing Low: 좌우 모든 저가보다 낮음
+            other_high = np.maximum(
+                high_win[:, :swing_period].max(axis=1, initial=-np.inf),
+                high_win[:, swing_period + 1:].max(axis=1, initial=-np.inf)
+            )
+            other_low = np.minimum(
+                low_win[:, :swing_period].min(axis=1, initial=np.inf),
+                low_win[:, swing_period + 1:].min(axis=1, initial=np.inf)
+            )
             
-            # Swing Low 체크
-            is_swing_low = True
-            for j in range(i - swing_period, i + swing_period + 1):
-                if j != i and df.iloc[j]['low'] <= candle['low']:
-                    is_swing_low = False
-                    break
-            if is_swing_low:
-                swing_lows.append((i, candle['low']))
-        
-        # 가장 최근의 스윙 포인트 선택
-        current_price = df.iloc[-1]['close']
-        
-        # 현재가 기준으로 가장 가까운 LP 찾기
-        closest_high = None
-        closest_low = None
-        
-        if swing_highs:
-            # 현재가 위의 가장 가까운 Swing High
-            highs_above = [(idx, level) for idx, level in swing_highs if level > current_price]
-            if highs_above:
-                closest_high = min(highs_above, key=lambda x: x[1] - current_price)
-        
-        if swing_lows:
-            # 현재가 아래의 가장 가까운 Swing Low
-            lows_below = [(idx, level) for idx, level in swing_lows if level < current_price]
-            if lows_below:
-                closest_low = max(lows_below, key=lambda x: x[1])
+            swing_high_levels = np.sort(center_high[other_high < center_high])
+            swing_low_levels = np.sort(center_low[other_low > center_low])
+        
+        current_price = closes[-1]
+        
+        # 현재가 기준으로 가장 가까운 LP 찾기 (정렬된 레벨에서 이진 탐색)
+        # - 현재가 위의 가장 가까운 Swing High / 현재가 아래의 가장 가까운 Swing Low
+        pos_high = np.searchsorted(swing_high_levels, current_price, side='right')
+        pos_low = np.searchsorted(swing_low_levels, current_price, side='left') - 1
+        closest_high = swing_high_levels[pos_high] if pos_high < len(swing_high_levels) else None
+        closest_low = swing_low_levels[pos_low] if pos_low >= 0 else None
         
         # 더 가까운 LP 반환
-        if closest_high and closest_low:
-            dist_high = closest_high[1] - current_price
-            dist_low = current_price - closest_low[1]
-            
-            if dist_high < dist_low:
-                level = closest_high[1]
-                buffer = level * buffer_percent / 100
-                return LiquidityPoolResult(
-                    found=True,
-                    pool_type="SWING_HIGH",
-                    level=level,
-                    zone_top=level + buffer,
-                    zone_bottom=level - buffer,
-                    touch_count=1
-                )
-            else:
-                level = closest_low[1]
-                buffer = level * buffer_percent / 100
-                return LiquidityPoolResult(
-                    found=True,
-                    pool_type="SWING_LOW",
-                    level=level,
-                    zone_top=level + buffer,
-                    zone_bottom=level - buffer,
-                    touch_count=1
-                )
-        elif closest_high:
-            level = closest_high[1]
-            buffer = level * buffer_percent / 100
-            return LiquidityPoolResult(
-                found=True,
-                pool_type="SWING_HIGH",
-                level=level,
-                zone_top=level + buffer,
-                zone_bottom=level - buffer,
-                touch_count=1
-            )
-        elif closest_low:
-            level = closest_low[1]
+        if closest_high is not None and (
+            closest_low is None or closest_high - current_price < current_price - closest_low
+        ):
+            pool_type, level = "SWING_HIGH", closest_high
+        elif closest_low is not None:
+            pool_type, level = "SWING_LOW", closest_low
+        else:
+            pool_type, level = None, None
+        
+        if pool_type is not None:
             buffer = level * buffer_percent / 100
             return LiquidityPoolResult(
                 found=True,
-                pool_type="SWING_LOW",
+                pool_type=pool_type,
                 level=level,
                 zone_top=level + buffer,
                 zone_bottom=level - buffer,
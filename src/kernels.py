@@ -0,0 +1,432 @@
+"""
+CryptoBot Studio - Numeric Kernels
+전략 핫패스용 수치 커널
+
+numba가 설치되어 있으면 명시적 시그니처로 import 시점에 미리 컴파일(cache=True)되고,
+미설치 환경에서는 동일한 로직이 순수 Python으로 실행됩니다.
+(첫 호출 시 JIT 지연 없음 - 캐시 위치는 NUMBA_CACHE_DIR 환경변수로 지정)
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, types
+except ImportError:  # numba 미설치 - no-op 데코레이터
+    types = None
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+# 방향 코드 (nopython 모드용 정수 인코딩)
+DIR_NONE = 0
+DIR_BULLISH = 1
+DIR_BEARISH = 2
+
+# 커널 시그니처
+# 입력 배열은 읽기 전용/임의 stride 허용 (pandas Copy-on-Write의 to_numpy 뷰 그대로 전달)
+if types is not None:
+    _F8_IN = types.Array(types.float64, 1, "A", readonly=True)
+    _SIG_RSI_TAIL = types.float64(_F8_IN, types.int64)
+    _SIG_RSI_SERIES = types.float64[::1](_F8_IN, types.int64)
+    _SIG_WILDER = types.UniTuple(types.float64, 2)(_F8_IN, types.int64)
+    _SIG_RSI_EMA_TAIL = types.UniTuple(types.float64, 5)(
+        _F8_IN, types.int64, types.float64, types.float64
+    )
+    _SIG_TREND_SERIES = types.Tuple((types.int8[::1], types.float32[::1]))(
+        _F8_IN, types.int64, types.float64, types.float64,
+        types.float64, types.float64, types.int64
+    )
+    _SIG_MACD_TAIL = types.UniTuple(types.float64, 4)(
+        _F8_IN, types.float64, types.float64, types.float64
+    )
+    _SIG_FVG_SCAN = types.UniTuple(types.int64, 2)(_F8_IN, _F8_IN, types.float64)
+    _SIG_OB_SCAN = types.UniTuple(types.int64, 3)(
+        _F8_IN, _F8_IN, _F8_IN, _F8_IN, types.int64, types.float64
+    )
+    _SIG_CONFLUENCE = types.UniTuple(types.int64, 6)(
+        types.boolean, types.int64, types.float64, types.float64,
+        types.boolean, types.int64, types.float64, types.float64,
+        types.boolean, types.float64
+    )
+else:
+    _SIG_RSI_TAIL = _SIG_RSI_SERIES = _SIG_WILDER = None
+    _SIG_RSI_EMA_TAIL = _SIG_TREND_SERIES = _SIG_MACD_TAIL = _SIG_CONFLUENCE = None
+    _SIG_FVG_SCAN = _SIG_OB_SCAN = None
+
+
+@njit(_SIG_RSI_TAIL, cache=True)
+def rsi_tail(close, rsi_period):
+    """
+    마지막 봉 RSI 계산 (최근 rsi_period개 변화량의 단순 평균, rolling mean 방식)
+
+    Args:
+        close: 종가 배열 (float64)
+        rsi_period: RSI 기간
+
+    Returns:
+        RSI (상승/하락이 모두 없으면 NaN)
+    """
+    n = close.shape[0]
+    gain_sum = 0.0
+    loss_sum = 0.0
+
+    for i in range(max(1, n - rsi_period), n):
+        d = close[i] - close[i - 1]
+        if d > 0:
+            gain_sum += d
+        elif d < 0:
+            loss_sum -= d
+
+    avg_gain = gain_sum / rsi_period
+    avg_loss = loss_sum / rsi_period
+    if avg_loss == 0:
+        return math.nan if avg_gain == 0 else 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit(_SIG_RSI_SERIES, cache=True)
+def rsi_series(close, rsi_period):
+    """
+    RSI 전체 계산 (rsi_tail과 같은 단순 평균 방식, 단일 패스)
+
+    pandas diff -> where -> rolling(period).mean() 체인과 같은 값이며,
+    상승/하락폭 합계를 구간 이동 시 더하고 빼서 중간 Series를 만들지 않습니다.
+
+    Args:
+        close: 종가 배열 (float64)
+        rsi_period: RSI 기간
+
+    Returns:
+        RSI 배열 (앞 rsi_period-1개와 상승/하락이 모두 없는 구간은 NaN)
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    gain_sum = 0.0
+    loss_sum = 0.0
+
+    for i in range(1, n):
+        d = close[i] - close[i - 1]
+        if d > 0:
+            gain_sum += d
+        elif d < 0:
+            loss_sum -= d
+
+        # 구간을 벗어난 변화량 제거 (첫 봉 변화량은 0)
+        j = i - rsi_period
+        if j >= 1:
+            d = close[j] - close[j - 1]
+            if d > 0:
+                gain_sum -= d
+            elif d < 0:
+                loss_sum += d
+
+        if i >= rsi_period - 1:
+            avg_gain = gain_sum / rsi_period
+            avg_loss = loss_sum / rsi_period
+            if avg_loss > 0:
+                out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            elif avg_gain > 0:
+                out[i] = 100.0
+
+    return out
+
+
+@njit(_SIG_WILDER, cache=True)
+def wilder_averages(close, period):
+    """
+    Wilder 평활 평균 상승/하락폭 (마지막 봉 값)
+
+    pandas ewm(alpha=1/period, adjust=False)와 동일하며,
+    첫 봉의 변화량은 0으로 시드합니다 (diff()의 NaN -> 0).
+
+    Args:
+        close: 종가 배열 (float64)
+        period: RSI 기간
+
+    Returns:
+        (avg_gain, avg_loss)
+    """
+    n = close.shape[0]
+    alpha = 1.0 / period
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(1, n):
+        d = close[i] - close[i - 1]
+        gain = d if d > 0 else 0.0
+        loss = -d if d < 0 else 0.0
+        avg_gain = alpha * gain + (1.0 - alpha) * avg_gain
+        avg_loss = alpha * loss + (1.0 - alpha) * avg_loss
+
+    return avg_gain, avg_loss
+
+
+@njit(_SIG_MACD_TAIL, cache=True)
+def macd_tail(close, a_fast, a_slow, a_signal):
+    """
+    MACD / Signal 마지막 두 봉 값 계산 (중간 배열 없이 한 번 순회)
+
+    fast/slow EMA는 첫 봉, Signal은 첫 MACD 값(0)으로 시드합니다
+    (pandas ewm(adjust=False)로 MACD Line -> Signal Line을 계산한 것과 동일).
+
+    Args:
+        close: 종가 배열 (float64)
+        a_fast: fast EMA 평활 계수 (2 / (span + 1))
+        a_slow: slow EMA 평활 계수
+        a_signal: Signal EMA 평활 계수
+
+    Returns:
+        (macd, macd_prev, signal, signal_prev)
+    """
+    n = close.shape[0]
+    ema_f = close[0]
+    ema_s = close[0]
+    macd = ema_f - ema_s
+    signal = macd
+    macd_prev = macd
+    signal_prev = signal
+
+    for i in range(1, n):
+        x = close[i]
+        macd_prev = macd
+        signal_prev = signal
+        ema_f = a_fast * x + (1.0 - a_fast) * ema_f
+        ema_s = a_slow * x + (1.0 - a_slow) * ema_s
+        macd = ema_f - ema_s
+        signal = a_signal * macd + (1.0 - a_signal) * signal
+
+    return macd, macd_prev, signal, signal_prev
+
+
+@njit(_SIG_RSI_EMA_TAIL, cache=True)
+def rsi_ema_tail(close, rsi_period, a_fast, a_slow):
+    """
+    RSI + EMA(fast/slow) 계산 (마지막 두 봉 값만 반환)
+
+    - RSI: rsi_tail 참고
+    - EMA: adjust=False 재귀식 (ema = a*close + (1-a)*ema), 첫 봉으로 시드
+
+    Args:
+        close: 종가 배열 (float64)
+        rsi_period: RSI 기간
+        a_fast: fast EMA 평활 계수 (2 / (span + 1))
+        a_slow: slow EMA 평활 계수
+
+    Returns:
+        (rsi, ema_fast, ema_fast_prev, ema_slow, ema_slow_prev)
+    """
+    n = close.shape[0]
+    ema_f = close[0]
+    ema_s = close[0]
+    ema_f_prev = ema_f
+    ema_s_prev = ema_s
+
+    for i in range(1, n):
+        x = close[i]
+        ema_f_prev = ema_f
+        ema_s_prev = ema_s
+        ema_f = a_fast * x + (1.0 - a_fast) * ema_f
+        ema_s = a_slow * x + (1.0 - a_slow) * ema_s
+
+    return rsi_tail(close, rsi_period), ema_f, ema_f_prev, ema_s, ema_s_prev
+
+
+@njit(_SIG_TREND_SERIES, cache=True)
+def trend_signal_series(
+    close, rsi_period, a_fast, a_slow,
+    rsi_oversold, rsi_overbought, min_length
+):
+    """
+    봉별 추세 추종 신호 일괄 계산 (백테스트용)
+
+    봉 i의 판단은 close[:i+1] 창으로 TrendFollowingAnalyzer.analyze를
+    호출한 것과 같습니다 (EMA는 첫 봉 시드, RSI는 rolling mean).
+
+    Returns:
+        (actions int8: BUY=1, SELL=-1, HOLD=0, confidences float32)
+        SELL은 보유 중일 때의 청산 조건 (익절/손절 제외)
+    """
+    n = close.shape[0]
+    actions = np.zeros(n, dtype=np.int8)
+    confidences = np.zeros(n, dtype=np.float32)
+    ema_f = close[0]
+    ema_s = close[0]
+
+    for i in range(1, n):
+        x = close[i]
+        prev_f = ema_f
+        prev_s = ema_s
+        ema_f = a_fast * x + (1.0 - a_fast) * ema_f
+        ema_s = a_slow * x + (1.0 - a_slow) * ema_s
+
+        if i + 1 < min_length:
+            continue
+
+        rsi = rsi_tail(close[:i + 1], rsi_period)
+        if math.isnan(rsi):
+            continue
+
+        golden_cross = prev_f <= prev_s and ema_f > ema_s
+        if golden_cross or (ema_f > ema_s and rsi_oversold < rsi < 50):
+            actions[i] = 1
+            confidences[i] = min(0.9, 0.7 + (50 - rsi) / 100)
+            continue
+
+        dead_cross = prev_f >= prev_s and ema_f < ema_s
+        if dead_cross or (ema_f < ema_s and 50 < rsi < rsi_overbought):
+            actions[i] = -1
+            confidences[i] = 0.7
+        else:
+            confidences[i] = 0.3
+
+    return actions, confidences
+
+
+@njit(_SIG_FVG_SCAN, cache=True)
+def fvg_scan(high, low, min_gap_percent):
+    """
+    가장 최근의 미충전 FVG 탐색 (뒤에서부터 1회 순회)
+
+    상승 FVG: high[i-2] < low[i], 이후 저가가 갭 하단(high[i-2]) 이하로 내려오지 않음
+    하락 FVG: low[i-2] > high[i], 이후 고가가 갭 상단(low[i-2]) 이상으로 올라오지 않음
+    충전 여부는 i 이후 구간의 최저가/최고가를 누적하며 판정합니다 (O(n)).
+
+    Args:
+        high: 고가 배열 (float64)
+        low: 저가 배열 (float64)
+        min_gap_percent: 최소 갭 크기 (%)
+
+    Returns:
+        (방향코드, 갭 완성 캔들 인덱스 i) - 없으면 (DIR_NONE, -1)
+    """
+    n = high.shape[0]
+    later_min_low = math.inf  # low[i+1:] 최저가
+    later_max_high = -math.inf  # high[i+1:] 최고가
+
+    for i in range(n - 1, 2, -1):
+        # 상승 FVG
+        gap_bottom = high[i - 2]
+        gap_top = low[i]
+        if gap_bottom < gap_top:
+            if (gap_top - gap_bottom) / gap_bottom * 100 >= min_gap_percent and later_min_low > gap_bottom:
+                return DIR_BULLISH, i
+
+        # 하락 FVG
+        gap_top = low[i - 2]
+        gap_bottom = high[i]
+        if gap_top > gap_bottom:
+            if (gap_top - gap_bottom) / gap_bottom * 100 >= min_gap_percent and later_max_high < gap_top:
+                return DIR_BEARISH, i
+
+        if low[i] < later_min_low:
+            later_min_low = low[i]
+        if high[i] > later_max_high:
+            later_max_high = high[i]
+
+    return DIR_NONE, -1
+
+
+@njit(_SIG_OB_SCAN, cache=True)
+def order_block_scan(opens, highs, lows, closes, min_consecutive, min_body_ratio):
+    """
+    가장 최근의 Order Block 탐색 (뒤에서부터 순회)
+
+    각 봉 i에서 최대 5봉을 거슬러 연속 양봉/음봉을 세고,
+    연속 상승 직전의 음봉(상승 OB) 또는 연속 하락 직전의 양봉(하락 OB)의
+    몸통 비율이 min_body_ratio 이상이면 반환합니다.
+
+    Args:
+        opens, highs, lows, closes: 시가/고가/저가/종가 배열 (float64)
+        min_consecutive: 최소 연속 캔들 수
+        min_body_ratio: 최소 몸통 비율 (0~1)
+
+    Returns:
+        (방향코드, OB 캔들 인덱스, 연속 캔들 수) - 없으면 (DIR_NONE, -1, 0)
+    """
+    n = closes.shape[0]
+
+    for i in range(n - 1, min_consecutive + 1, -1):
+        consecutive_up = 0
+        consecutive_down = 0
+
+        for j in range(i, max(i - 5, 0), -1):
+            if closes[j] > opens[j]:
+                consecutive_up += 1
+                consecutive_down = 0
+            else:
+                consecutive_down += 1
+                consecutive_up = 0
+
+            if consecutive_up >= min_consecutive or consecutive_down >= min_consecutive:
+                break
+
+        # 상승 OB: 연속 상승 직전의 마지막 음봉
+        if consecutive_up >= min_consecutive:
+            ob = i - consecutive_up
+            if ob >= 0 and closes[ob] < opens[ob]:
+                total_range = highs[ob] - lows[ob]
+                body_ratio = abs(closes[ob] - opens[ob]) / total_range if total_range > 0 else 0.0
+                if body_ratio >= min_body_ratio:
+                    return DIR_BULLISH, ob, consecutive_up
+
+        # 하락 OB: 연속 하락 직전의 마지막 양봉
+        if consecutive_down >= min_consecutive:
+            ob = i - consecutive_down
+            if ob >= 0 and closes[ob] > opens[ob]:
+                total_range = highs[ob] - lows[ob]
+                body_ratio = abs(closes[ob] - opens[ob]) / total_range if total_range > 0 else 0.0
+                if body_ratio >= min_body_ratio:
+                    return DIR_BEARISH, ob, consecutive_down
+
+    return DIR_NONE, -1, 0
+
+
+@njit(_SIG_CONFLUENCE, cache=True)
+def confluence_score(
+    ob_found, ob_dir, ob_bottom, ob_top,
+    fvg_found, fvg_dir, fvg_bottom, fvg_top,
+    lp_found, price
+):
+    """
+    ICT Confluence 점수 계산
+
+    - Order Block: 30점 (+10 가격이 OB 영역 내)
+    - FVG: 30점 (+10 가격이 FVG 영역 내)
+    - Liquidity Pool: 20점
+
+    방향은 OB 우선, 없으면 FVG, 둘 다 없으면 BULLISH.
+    price가 0이면 영역 내 가산점은 계산하지 않습니다.
+
+    Returns:
+        (총점, OB점수, FVG점수, LP점수, 영역점수, 방향코드)
+    """
+    # 분기 없는 산술식 (bool은 0/1로 계산)
+    ob_in_zone = ob_found and price != 0.0 and ob_bottom <= price <= ob_top
+    fvg_in_zone = fvg_found and price != 0.0 and fvg_bottom <= price <= fvg_top
+
+    d_ob = 30 * ob_found
+    d_fvg = 30 * fvg_found
+    d_lp = 20 * lp_found
+    d_zone = 10 * ob_in_zone + 10 * fvg_in_zone
+    direction = ob_dir if ob_found else (fvg_dir if fvg_found else DIR_BULLISH)
+
+    return d_ob + d_fvg + d_lp + d_zone, d_ob, d_fvg, d_lp, d_zone, direction
+
+
+# Test
+if __name__ == "__main__":
+    print("=== Kernels Test ===\n")
+
+    prices = np.array([100.0 + (i % 7) - (i % 3) for i in range(60)], dtype=np.float64)
+    rsi, ef, ef_prev, es, es_prev = rsi_ema_tail(prices, 14, 2.0 / 13, 2.0 / 27)
+
+    print(f"RSI: {rsi:.2f}")
+    print(f"EMA Fast: {ef:.2f} (prev {ef_prev:.2f})")
+    print(f"EMA Slow: {es:.2f} (prev {es_prev:.2f})")
@@ -74,6 +74,7 @@ class CryptoBotOrchestrator:
         self._last_report_date = None
         self._last_weekly_report_date = None  # 주간 리포트 추적
         self._last_trend_alert_hour = None  # 시장 동향 알림 추적
+        self._tz = pytz.timezone(settings.timezone)  # 리포트 시각 판정용 (1회 생성)
         
         logger.info("🤖 CryptoBot Studio 초기화 완료")
     
@@ -133,11 +134,13 @@ class CryptoBotOrchestrator:
         if now.hour == 23 and 50 <= now.minute < 55:
             await self._send_daily_report()
     
-    async def _check_weekly_report(self):
+    async def _check_weekly_report(self, now: datetime):
         """
         매주 일요일 09:00에 시장 분석 리포트 발송
+        
+        Args:
+            now: 현재 시각 (settings.timezone 기준)
         """
-        now = datetime.now(pytz.timezone(settings.timezone))
         today = now.date()
         
         # 일요일(6) 09:00~09:05 사이에 발송
@@ -155,8 +158,14 @@ class CryptoBotOrchestrator:
                 analyzer = MarketAnalyzer()
                 market_states = {}
                 
-                for symbol in self.trader.target_symbols:
-                    df = pyupbit.get_ohlcv(symbol, interval="minute60", count=100)
+                # 심볼별 캔들은 스레드에서 동시에 조회 (이벤트 루프 비차단)
+                symbols = self.trader.target_symbols
+                dfs = await asyncio.gather(*(
+                    asyncio.to_thread(pyupbit.get_ohlcv, symbol, interval="minute60", count=100)
+                    for symbol in symbols
+                ))
+                
+                for symbol, df in zip(symbols, dfs):
                     if df is not None:
                         state = analyzer.analyze(df)
                         market_states[symbol] = state
@@ -168,11 +177,13 @@ class CryptoBotOrchestrator:
             except Exception as e:
                 logger.error(f"주간 리포트 발송 에러: {e}")
     
-    async def _check_market_trend_alert(self):
+    async def _check_market_trend_alert(self, now: datetime):
         """
         매일 23:50과 08:50에 시장 동향 알림 발송 (BTC 기준)
+        
+        Args:
+            now: 현재 시각 (settings.timezone 기준)
         """
-        now = datetime.now(pytz.timezone(settings.timezone))
         current_hour = now.hour
         current_minute = now.minute
         
@@ -192,7 +203,7 @@ class CryptoBotOrchestrator:
                 analyzer = MarketAnalyzer()
                 
                 # BTC만 분석
-                df = pyupbit.get_ohlcv("KRW-BTC", interval="minute60", count=100)
+                df = await asyncio.to_thread(pyupbit.get_ohlcv, "KRW-BTC", interval="minute60", count=100)
                 if df is not None:
                     btc_state = analyzer.analyze(df)
                     if btc_state:
@@ -232,19 +243,22 @@ class CryptoBotOrchestrator:
                 for result in results:
                     if result.success:
                         if result.action not in ["HOLD", "ANALYZE"]:
-                            logger.success(f"✅ {result}")
+                            logger.success("✅ {}", result)
                     else:
                         if result.error:
-                            logger.warning(f"⚠️ {result}")
+                            logger.warning("⚠️ {}", result)
                 
                 # 일일 리포트 체크
                 await self._check_daily_report()
                 
+                # 주간 리포트/시장 동향 알림은 같은 현재 시각으로 판정 (사이클당 1회 조회)
+                now = datetime.now(self._tz)
+                
                 # 주간 시장 분석 리포트 체크 (일요일 09:00)
-                await self._check_weekly_report()
+                await self._check_weekly_report(now)
                 
                 # 시장 동향 알림 체크 (23:50, 08:50)
-                await self._check_market_trend_alert()
+                await self._check_market_trend_alert(now)
                 
                 # 다음 체크까지 대기
                 await asyncio.sleep(self.check_interval)
@@ -12,6 +12,8 @@ from dataclasses import dataclass
 from enum import Enum
 from loguru import logger
 
+from kernels import rsi_tail
+
 
 class VolatilityRegime(Enum):
     """변동성 레짐"""
@@ -29,6 +31,12 @@ class TrendRegime(Enum):
     STRONG_DOWN = "STRONG_DOWN" # ADX 25+ & -DI > +DI
 
 
+# 추세 그룹 (호출마다 리스트를 만들지 않도록 모듈 수준 frozenset)
+_UP_TRENDS = frozenset({TrendRegime.STRONG_UP, TrendRegime.WEAK_UP})
+_DOWN_TRENDS = frozenset({TrendRegime.STRONG_DOWN, TrendRegime.WEAK_DOWN})
+_STRONG_TRENDS = frozenset({TrendRegime.STRONG_UP, TrendRegime.STRONG_DOWN})
+
+
 @dataclass
 class MarketState:
     """시장 상태"""
@@ -48,7 +56,7 @@ class MarketState:
         - +DI > -DI (상승 추세) = STRONG_UP or WEAK_UP
         - RSI 35~70 (과매수 아님)
         """
-        is_uptrend = self.trend in [TrendRegime.STRONG_UP, TrendRegime.WEAK_UP]
+        is_uptrend = self.trend in _UP_TRENDS
         rsi_ok = 35 <= self.rsi <= 70
         return is_uptrend and rsi_ok
     
@@ -58,7 +66,7 @@ class MarketState:
         - 하락 추세 (STRONG_DOWN or WEAK_DOWN)
         - 또는 RSI < 35 (급락)
         """
-        is_downtrend = self.trend in [TrendRegime.STRONG_DOWN, TrendRegime.WEAK_DOWN]
+        is_downtrend = self.trend in _DOWN_TRENDS
         rsi_crash = self.rsi < 35
         return is_downtrend or rsi_crash
     
@@ -214,7 +222,7 @@ class MarketAnalyzer:
         """
         # 고변동성 시장 → 보수적
         if volatility == VolatilityRegime.HIGH:
-            if trend in [TrendRegime.STRONG_UP, TrendRegime.STRONG_DOWN]:
+            if trend in _STRONG_TRENDS:
                 return "CONSERVATIVE_TREND", 0.5  # 추세는 따르되 작게
             else:
                 return "SKIP", 0.0  # 고변동 횡보는 위험
@@ -223,7 +231,7 @@ class MarketAnalyzer:
         if volatility == VolatilityRegime.LOW:
             if trend == TrendRegime.RANGING:
                 return "ICT_MEAN_REVERSION", 1.0  # 레인징에서 ICT 강점
-            elif trend in [TrendRegime.STRONG_UP, TrendRegime.WEAK_UP]:
+            elif trend in _UP_TRENDS:
                 return "TREND_FOLLOWING", 1.2  # 안정적 상승 추세
             else:
                 return "SKIP", 0.0  # 저변동 하락 조심
@@ -242,7 +250,7 @@ class MarketAnalyzer:
                 return "SKIP", 0.0
         
         # 하락 추세는 보수적
-        if trend in [TrendRegime.WEAK_DOWN, TrendRegime.STRONG_DOWN]:
+        if trend in _DOWN_TRENDS:
             return "SKIP", 0.0
         
         return "ICT_CONFLUENCE", 0.7  # 기본값
@@ -264,10 +272,15 @@ class MarketAnalyzer:
         # 지표 계산
         atr = self.calculate_atr(df)
         adx, plus_di, minus_di = self.calculate_adx(df)
-        rsi = self.calculate_rsi(df)
         
-        current_price = df['close'].iloc[-1]
-        current_atr = atr.iloc[-1]
+        # 마지막 값은 ndarray 버퍼에서 한 번에 읽기 (.iloc 인덱서 반복 방지)
+        close = df['close'].to_numpy(dtype=np.float64)
+        current_price = close[-1]
+        current_atr = atr.to_numpy()[-1]
+        current_adx = adx.to_numpy()[-1]
+        current_plus_di = plus_di.to_numpy()[-1]
+        current_minus_di = minus_di.to_numpy()[-1]
+        current_rsi = rsi_tail(close, 14)  # 마지막 RSI만 필요 - 전체 Series 생성 생략
         current_atr_pct = (current_atr / current_price) * 100
         
         # ATR % 히스토리
@@ -275,15 +288,11 @@ class MarketAnalyzer:
         
         # 레짐 결정
         volatility = self.get_volatility_regime(current_atr_pct, atr_pct_history.tail(self.lookback))
-        trend = self.get_trend_regime(
-            adx.iloc[-1],
-            plus_di.iloc[-1],
-            minus_di.iloc[-1]
-        )
+        trend = self.get_trend_regime(current_adx, current_plus_di, current_minus_di)
         
         # 전략 추천
         strategy, size_mult = self.get_recommended_strategy(
-            volatility, trend, rsi.iloc[-1]
+            volatility, trend, current_rsi
         )
         
         return MarketState(
@@ -291,8 +300,8 @@ class MarketAnalyzer:
             trend=trend,
             atr=current_atr,
             atr_percent=current_atr_pct,
-            adx=adx.iloc[-1] if not np.isnan(adx.iloc[-1]) else 0,
-            rsi=rsi.iloc[-1] if not np.isnan(rsi.iloc[-1]) else 50,
+            adx=current_adx if not np.isnan(current_adx) else 0,
+            rsi=current_rsi if not np.isnan(current_rsi) else 50,
             recommended_strategy=strategy,
             position_size_multiplier=size_mult
         )
@@ -13,6 +13,8 @@ from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from loguru import logger
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
 import json
 import os
 
@@ -85,7 +87,8 @@ class BacktestEngine:
         self,
         df: pd.DataFrame,
         strategy: ICTStrategy,
-        position_size_ratio: float = 0.3
+        position_size_ratio: float = 0.3,
+        panel: Optional[List[dict]] = None
     ) -> BacktestResult:
         """
         백테스트 실행
@@ -94,6 +97,7 @@ class BacktestEngine:
             df: OHLCV DataFrame (시간순 정렬)
             strategy: 테스트할 전략
             position_size_ratio: 포지션 크기 비율
+            panel: 봉별 지표 항목 (indicator_panel(df), 여러 전략 백테스트 간 공유)
             
         Returns:
             BacktestResult
@@ -121,22 +125,23 @@ class BacktestEngine:
         entry_time = None
         entry_reason = ""
         
-        # 시간 인덱스 확보
-        df = df.reset_index()
+        # 종가/시간은 배열로 한 번만 추출 (봉마다 reset_index/set_index 재구성 방지)
+        closes = df['close'].to_numpy(dtype=np.float64)
+        times = df.index
         
         for i in range(50, len(df)):
-            # 현재까지의 데이터로 분석
-            window_df = df.iloc[:i+1].set_index('index')
-            current_row = df.iloc[i]
-            current_price = current_row['close']
-            current_time = current_row['index'] if 'index' in df.columns else datetime.now()
+            # 현재까지의 데이터로 분석 (원본 인덱스 그대로 슬라이스)
+            window_df = df.iloc[:i+1]
+            current_price = closes[i]
+            current_time = times[i]
             
             # 전략 분석
             signal = strategy.analyze(
                 ohlcv_df=window_df,
                 current_price=current_price,
                 entry_price=entry_price if in_position else None,
-                in_position=in_position
+                in_position=in_position,
+                indicators=panel[i] if panel is not None else None
             )
             
             if not in_position and signal.action == "BUY" and signal.confidence >= 0.7:
@@ -249,6 +254,35 @@ class BacktestEngine:
         )
 
 
+# 워커 프로세스 전역 (initializer에서 한 번만 전달 - 조합마다 DataFrame 피클링 방지)
+_worker_engine: Optional[BacktestEngine] = None
+_worker_df: Optional[pd.DataFrame] = None
+
+
+def _init_worker(engine: BacktestEngine, df: pd.DataFrame):
+    """워커 프로세스 초기화"""
+    global _worker_engine, _worker_df
+    _worker_engine = engine
+    _worker_df = df
+
+
+def _run_combo(params: Dict[str, Any], engine: BacktestEngine = None, df: pd.DataFrame = None) -> BacktestResult:
+    """파라미터 조합 1개 백테스트 (프로세스 풀에서 호출 가능한 최상위 함수)"""
+    engine = engine or _worker_engine
+    df = _worker_df if df is None else df
+    
+    strategy = ICTStrategy(
+        confluence_threshold=params.get("confluence_threshold", 80),
+        min_rr_ratio=params.get("min_rr_ratio", 2.0),
+        take_profit=params.get("take_profit", 2.0),
+        stop_loss=params.get("stop_loss", 1.0)
+    )
+    
+    result = engine.run_backtest(df, strategy)
+    result.params = params  # 파라미터 저장
+    return result
+
+
 class ParameterOptimizer:
     """
     파라미터 최적화기
@@ -263,7 +297,8 @@ class ParameterOptimizer:
     def grid_search(
         self,
         df: pd.DataFrame,
-        param_grid: Dict[str, List[Any]]
+        param_grid: Dict[str, List[Any]],
+        max_workers: Optional[int] = None
     ) -> Tuple[BacktestResult, List[BacktestResult]]:
         """
         Grid Search 실행
@@ -276,12 +311,11 @@ class ParameterOptimizer:
                     "take_profit": [1.0, 1.5, 2.0],
                     "stop_loss": [0.5, 0.75, 1.0]
                 }
+            max_workers: 병렬 프로세스 수 (None: CPU 코어 수, 1: 순차 실행)
                 
         Returns:
             (최적 결과, 전체 결과 리스트)
         """
-        from itertools import product
-        
         # 파라미터 조합 생성
         param_names = list(param_grid.keys())
         param_values = list(param_grid.values())
@@ -290,25 +324,29 @@ class ParameterOptimizer:
         logger.info(f"🔍 Grid Search 시작: {len(combinations)}개 조합 테스트")
         
         self.results = []
+        params_list = [dict(zip(param_names, combo)) for combo in combinations]
         
-        for i, combo in enumerate(combinations):
-            params = dict(zip(param_names, combo))
-            
-            # 전략 생성
-            strategy = ICTStrategy(
-                confluence_threshold=params.get("confluence_threshold", 80),
-                min_rr_ratio=params.get("min_rr_ratio", 2.0),
-                take_profit=params.get("take_profit", 2.0),
-                stop_loss=params.get("stop_loss", 1.0)
-            )
-            
-            # 백테스트 실행
-            result = self.engine.run_backtest(df, strategy)
-            result.params = params  # 파라미터 저장
-            self.results.append(result)
-            
-            if (i + 1) % 10 == 0:
-                logger.info(f"   진행: {i + 1}/{len(combinations)}")
+        # 조합별 백테스트는 서로 독립 (CPU 바운드) - 프로세스 풀로 GIL 우회
+        if max_workers != 1 and len(params_list) > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.engine, df)
+                ) as executor:
+                    for i, result in enumerate(executor.map(_run_combo, params_list)):
+                        self.results.append(result)
+                        if (i + 1) % 10 == 0:
+                            logger.info(f"   진행: {i + 1}/{len(params_list)}")
+            except Exception as e:
+                logger.error(f"병렬 Grid Search 실패, 순차 실행으로 전환: {e}")
+                self.results = []
+        
+        if not self.results:
+            for i, params in enumerate(params_list):
+                self.results.append(_run_combo(params, self.engine, df))
+                if (i + 1) % 10 == 0:
+                    logger.info(f"   진행: {i + 1}/{len(params_list)}")
         
         # 최적 결과 선택 (Total Profit 기준)
         if not self.results:
@@ -54,6 +54,9 @@ class RiskManager:
         self.MAX_DAILY_TRADES = max_daily_trades or settings.max_daily_trades
         self.MAX_DAILY_LOSS = max_daily_loss or settings.max_daily_loss
         
+        # 거래당 예상 손실 비율 (손절률 + 슬리피지 여유 20%) - 실행 중 바뀌지 않으므로 1회 계산
+        self._loss_ratio = settings.ict_stop_loss / 100 * 1.2
+        
         self.current_stats = self._load_today_stats()
         
         logger.info("📊 Risk Manager 초기화 완료")
@@ -133,7 +136,7 @@ class RiskManager:
             
             # 손실 가능성 체크 (손절가 기준)
             # 5,000원 진입 시 100% 손실이 아니라, 설정된 손절률(예: 1%) + 슬리피지 여유분까지만 리스크로 산정
-            estimated_loss = amount * (settings.ict_stop_loss / 100) * 1.2
+            estimated_loss = amount * self._loss_ratio
             
             # 현재 누적 손익 - 이번 거래 예상 손실 < -일일 손실 한도
             potential_total_profit = self.current_stats.total_profit - estimated_loss
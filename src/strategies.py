@@ -9,29 +9,88 @@ Removed deprecated strategies:
 - BollingerBandStrategy
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Literal
+from typing import Optional, Literal, NamedTuple, ClassVar, Dict, List
 from dataclasses import dataclass
 from loguru import logger
 
-from indicators import BollingerBandsResult
+from indicators import detect_fvg, detect_order_block, detect_liquidity_pool
+from kernels import confluence_score, DIR_NONE, DIR_BULLISH, DIR_BEARISH
 
 
-@dataclass
+# 방향 문자열 -> 커널 방향 코드
+_DIRECTION_CODE = {"BULLISH": DIR_BULLISH, "BEARISH": DIR_BEARISH}
+
+# ICT 지표 캐시 (전략 인스턴스 간 공유)
+# (종목, 마지막 봉 시각, 봉 수, 마지막 봉 종가/고가/저가) -> {"ob", "lp", ("fvg", min_gap_percent)}
+_IND_CACHE_SIZE = 32  # 종목 수 x 전략 프로필 수 이상으로 유지
+_ind_cache: Dict[tuple, dict] = {}
+
+
+def _indicator_cache_entry(ohlcv_df, symbol: Optional[str]) -> dict:
+    """
+    OHLCV 데이터별 ICT 지표 캐시 항목 (계산된 지표만 채워짐)
+    
+    같은 종목의 같은 봉 데이터를 여러 전략/인스턴스가 분석하거나 다시 분석하면
+    (미완성 봉 가격 변화 없음) 캐시된 결과를 재사용합니다.
+    마지막 봉이 같은 다른 종목(예: 스테이블코인)과 섞이지 않도록 종목을 키에 포함하며,
+    종목을 모르면 캐시하지 않습니다.
+    """
+    if symbol is None:
+        return {}
+    key = (
+        symbol,
+        ohlcv_df.index[-1],
+        len(ohlcv_df),
+        ohlcv_df['close'].to_numpy()[-1],
+        ohlcv_df['high'].to_numpy()[-1],
+        ohlcv_df['low'].to_numpy()[-1]
+    )
+    entry = _ind_cache.get(key)
+    if entry is None:
+        if len(_ind_cache) >= _IND_CACHE_SIZE:
+            _ind_cache.pop(next(iter(_ind_cache)))  # 가장 오래된 항목 제거
+        entry = _ind_cache[key] = {}
+    return entry
+
+
+def indicator_panel(ohlcv_df) -> List[dict]:
+    """
+    봉별 ICT 지표 항목 목록 (백테스트용)
+    
+    panel[i]는 ohlcv_df.iloc[:i+1] 창의 지표 캐시 항목입니다.
+    같은 데이터로 여러 전략 프로필을 백테스트할 때 첫 전략이 채운 지표를
+    이후 전략이 그대로 재사용합니다 (공유 LRU 캐시 축출과 무관).
+    """
+    return [{} for _ in range(len(ohlcv_df))]
+
+
+@dataclass(slots=True, frozen=True)
 class Signal:
-    """거래 신호"""
+    """거래 신호 (불변)"""
     action: Literal["BUY", "SELL", "HOLD"]
     strategy: str
     confidence: float  # 0.0 ~ 1.0
     reason: str
     
+    _EMOJI: ClassVar[Dict[str, str]] = {"BUY": "🟢", "SELL": "🔴", "HOLD": "⚪"}
+    
     def __str__(self):
-        emoji = "🟢" if self.action == "BUY" else "🔴" if self.action == "SELL" else "⚪"
-        return f"{emoji} {self.action} ({self.strategy}) - {self.reason} [신뢰도: {self.confidence:.0%}]"
+        return f"{self._EMOJI[self.action]} {self.action} ({self.strategy}) - {self.reason} [신뢰도: {self.confidence:.0%}]"
+
+
+class ConfluenceDetails(NamedTuple):
+    """Confluence 점수 상세내역"""
+    order_block: int
+    fvg: int
+    liquidity_pool: int
+    price_in_zone: int
 
 
 class BaseStrategy(ABC):
     """전략 베이스 클래스"""
     
+    __slots__ = ()
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -53,8 +112,16 @@ class FVGStrategy(BaseStrategy):
     - 탐지: candle[N-2].high < candle[N].low
     - 매수: 가격이 갭 영역 내로 되돌아올 때
     - 손절: candle[N-1].low 이탈
+    
+    FVG 추적 상태:
+    - 탐지: 첫 호출, 새 봉 시작, 진행 중인 봉의 고가/저가 변경(새 갭 형성 가능),
+      추적 중인 FVG 무효화(갭 충전) 시에만 detect_fvg 실행
+    - 추적: 마지막 봉 시각/고가/저가가 그대로면 추적 중인 FVG와 현재가만 비교
+    (인스턴스당 한 종목을 추적합니다)
     """
     
+    __slots__ = ('min_gap_percent', '_active_fvg', '_active_fvg_bar', '_wait_signal')
+    
     def __init__(self, min_gap_percent: float = 0.05):
         """
         Args:
@@ -62,16 +129,38 @@ class FVGStrategy(BaseStrategy):
         """
         self.min_gap_percent = min_gap_percent
         self._active_fvg = None  # 현재 추적 중인 FVG
+        self._active_fvg_bar = None  # FVG를 탐지한 마지막 봉 (시각, 봉 수, 고가, 저가)
+        self._wait_signal = None  # 추적 중인 FVG의 터치 대기 신호 (FVG별 1회 생성)
     
     @property
     def name(self) -> str:
         return "ICT_FVG"
     
+    @staticmethod
+    def _is_filled(fvg_result, current_price: float) -> bool:
+        """현재가가 갭을 충전했는지 (추적 중인 FVG 무효화)"""
+        if fvg_result.direction == "BULLISH":
+            return current_price <= fvg_result.gap_bottom
+        return current_price >= fvg_result.gap_top
+    
+    # 고정 HOLD 신호 (불변 Signal 재사용 - 호출마다 생성하지 않음)
+    _HOLD_NO_DATA: ClassVar[Signal] = Signal("HOLD", "ICT_FVG", 0.0, "OHLCV 데이터 없음")
+    _HOLD_NO_FVG: ClassVar[Signal] = Signal("HOLD", "ICT_FVG", 0.3, "FVG 미발견")
+    _HOLD_NO_PRICE: ClassVar[Signal] = Signal("HOLD", "ICT_FVG", 0.0, "현재가 정보 없음")
+    _HOLD_BEARISH: ClassVar[Signal] = Signal("HOLD", "ICT_FVG", 0.4, "하락 FVG 감지 (매도 대기)")
+    _HOLD_NO_SETUP: ClassVar[Signal] = Signal("HOLD", "ICT_FVG", 0.3, "조건 미충족")
+    
+    # 가변 사유 템플릿
+    _REASON_STOP_LOSS: ClassVar[str] = "손절: 현재가 ₩{:,.0f} < SL ₩{:,.0f}"
+    _REASON_ENTRY: ClassVar[str] = "FVG 진입: 갭 ₩{:,.0f}~₩{:,.0f} 내 (RR:{:.1f})"
+    _REASON_WAIT: ClassVar[str] = "대기: 갭 ₩{:,.0f}~₩{:,.0f} 터치 대기 중"
+    
     def analyze(
         self,
         ohlcv_df=None,
         current_price: float = None,
         fvg_result=None,
+        symbol: str = None,
         **kwargs
     ) -> Signal:
         """
@@ -81,41 +170,51 @@ class FVGStrategy(BaseStrategy):
             ohlcv_df: OHLCV DataFrame
             current_price: 현재가
             fvg_result: 미리 계산된 FVGResult (선택사항)
+            symbol: 종목 (지표 캐시 키, 없으면 캐시하지 않음)
             
         Returns:
             Signal
         """
-        from indicators import detect_fvg, FVGResult
-        
         # FVG 결과가 없으면 직접 탐지
         if fvg_result is None:
             if ohlcv_df is None:
-                return Signal(
-                    action="HOLD",
-                    strategy=self.name,
-                    confidence=0.0,
-                    reason="OHLCV 데이터 없음"
-                )
-            fvg_result = detect_fvg(ohlcv_df, min_gap_percent=self.min_gap_percent)
+                return self._HOLD_NO_DATA
+            
+            active = self._active_fvg
+            last_bar = (
+                ohlcv_df.index[-1],
+                len(ohlcv_df),
+                ohlcv_df['high'].to_numpy()[-1],
+                ohlcv_df['low'].to_numpy()[-1]
+            )
+            if (
+                active is not None
+                and current_price is not None
+                and last_bar == self._active_fvg_bar
+                and not self._is_filled(active, current_price)
+            ):
+                # 같은 봉 + 고가/저가 변화 없음 + 갭 유지 - 재탐지 생략
+                fvg_result = active
+            else:
+                entry = _indicator_cache_entry(ohlcv_df, symbol)
+                fvg_key = ("fvg", self.min_gap_percent)
+                fvg_result = entry.get(fvg_key)
+                if fvg_result is None:
+                    fvg_result = entry[fvg_key] = detect_fvg(ohlcv_df, min_gap_percent=self.min_gap_percent)
+                self._active_fvg_bar = last_bar
+        else:
+            self._active_fvg_bar = None  # 외부 결과는 다음 호출에서 재탐지
         
         if fvg_result is None or not fvg_result.found:
             self._active_fvg = None
-            return Signal(
-                action="HOLD",
-                strategy=self.name,
-                confidence=0.3,
-                reason="FVG 미발견"
-            )
+            return self._HOLD_NO_FVG
         
         if current_price is None:
-            return Signal(
-                action="HOLD",
-                strategy=self.name,
-                confidence=0.0,
-                reason="현재가 정보 없음"
-            )
+            return self._HOLD_NO_PRICE
         
         # FVG 발견됨 - 추적 시작
+        if fvg_result is not self._active_fvg:
+            self._wait_signal = None
         self._active_fvg = fvg_result
         
         # 상승 FVG (Bullish)
@@ -126,7 +225,7 @@ class FVGStrategy(BaseStrategy):
                     action="SELL",  # 손절
                     strategy=self.name,
                     confidence=0.9,
-                    reason=f"손절: 현재가 ₩{current_price:,.0f} < SL ₩{fvg_result.stop_loss:,.0f}"
+                    reason=self._REASON_STOP_LOSS.format(current_price, fvg_result.stop_loss)
                 )
             
             # 매수 진입 조건: 가격이 갭 영역 내로 진입
@@ -136,39 +235,33 @@ class FVGStrategy(BaseStrategy):
                 reward = fvg_result.take_profit - current_price
                 rr_ratio = reward / risk if risk > 0 else 0
                 
-                confidence = min(0.9, 0.6 + (rr_ratio * 0.1))  # RR이 좋을수록 신뢰도 증가
+                confidence = 0.6 + (rr_ratio * 0.1)  # RR이 좋을수록 신뢰도 증가
+                if confidence > 0.9:
+                    confidence = 0.9
                 
                 return Signal(
                     action="BUY",
                     strategy=self.name,
                     confidence=confidence,
-                    reason=f"FVG 진입: 갭 ₩{fvg_result.gap_bottom:,.0f}~₩{fvg_result.gap_top:,.0f} 내 (RR:{rr_ratio:.1f})"
+                    reason=self._REASON_ENTRY.format(fvg_result.gap_bottom, fvg_result.gap_top, rr_ratio)
                 )
             
-            # 갭 위에서 대기 중
+            # 갭 위에서 대기 중 (사유가 FVG에만 의존 - 추적 중에는 같은 신호 재사용)
             if current_price > fvg_result.gap_top:
-                return Signal(
-                    action="HOLD",
-                    strategy=self.name,
-                    confidence=0.5,
-                    reason=f"대기: 갭 ₩{fvg_result.gap_bottom:,.0f}~₩{fvg_result.gap_top:,.0f} 터치 대기 중"
-                )
+                if self._wait_signal is None:
+                    self._wait_signal = Signal(
+                        action="HOLD",
+                        strategy=self.name,
+                        confidence=0.5,
+                        reason=self._REASON_WAIT.format(fvg_result.gap_bottom, fvg_result.gap_top)
+                    )
+                return self._wait_signal
         
         # 하락 FVG (Bearish) - 현재는 매수만 지원
         if fvg_result.direction == "BEARISH":
-            return Signal(
-                action="HOLD",
-                strategy=self.name,
-                confidence=0.4,
-                reason=f"하락 FVG 감지 (매도 대기)"
-            )
+            return self._HOLD_BEARISH
         
-        return Signal(
-            action="HOLD",
-            strategy=self.name,
-            confidence=0.3,
-            reason="조건 미충족"
-        )
+        return self._HOLD_NO_SETUP
     
     def get_active_fvg(self):
         """현재 활성 FVG 반환"""
@@ -193,6 +286,11 @@ class ICTStrategy(BaseStrategy):
     - 목표: 일일 1% 안정 수익
     """
     
+    __slots__ = (
+        'confluence_threshold', 'min_rr_ratio', 'take_profit', 'stop_loss',
+        '_last_signal', '_hold_suffix'
+    )
+    
     def __init__(
         self,
         confluence_threshold: int = 80,  # 진입 최소 점수
@@ -205,12 +303,26 @@ class ICTStrategy(BaseStrategy):
         self.take_profit = take_profit
         self.stop_loss = stop_loss
         self._last_signal = None
+        # 포지션 유지 사유의 고정 부분 (틱마다 포맷하지 않음)
+        self._hold_suffix = f"% (익절: +{take_profit}%, 손절: -{stop_loss}%)"
         
     @property
     def name(self) -> str:
         return "ICT_Confluence"
     
-    def calculate_confluence_score(
+    # 고정 HOLD 신호 (불변 Signal 재사용)
+    _HOLD_NO_PRICE: ClassVar[Signal] = Signal("HOLD", "ICT_Confluence", 0.0, "현재가 정보 없음")
+    _HOLD_NO_DATA: ClassVar[Signal] = Signal("HOLD", "ICT_Confluence", 0.0, "OHLCV 데이터 없음")
+    
+    # 가변 사유 템플릿
+    _REASON_TAKE_PROFIT: ClassVar[str] = "익절: +{:.2f}% (목표: {}%)"
+    _REASON_STOP_LOSS: ClassVar[str] = "손절: {:.2f}% (한도: -{}%)"
+    _REASON_BUY: ClassVar[str] = "ICT Confluence {}점 (OB:{}, FVG:{}, LP:{}) RR:{:.1f}"
+    _REASON_LOW_RR: ClassVar[str] = "점수 충족({}점) but 손익비 부족 (RR:{:.1f} < {})"
+    _REASON_BEARISH: ClassVar[str] = "ICT Bearish 신호 ({}점) - 매수 대기"
+    _REASON_BELOW: ClassVar[str] = "Confluence {}점 < {}점 (OB:{}, FVG:{}, LP:{})"
+    
+    def _confluence(
         self,
         ob_result,
         fvg_result,
@@ -218,46 +330,44 @@ class ICTStrategy(BaseStrategy):
         current_price: float = None
     ) -> tuple:
         """
-        Confluence 점수 계산
+        결과 객체를 스칼라로 풀어 confluence_score 커널 호출
         
         Returns:
-            (총점, 상세내역 dict)
+            (총점, ConfluenceDetails, 방향코드)
         """
-        score = 0
-        details = {
-            "order_block": 0,
-            "fvg": 0,
-            "liquidity_pool": 0,
-            "price_in_zone": 0
-        }
+        ob_found = bool(ob_result and ob_result.found)
+        fvg_found = bool(fvg_result and fvg_result.found)
         
-        # 1. Order Block (+30점)
-        if ob_result and ob_result.found:
-            details["order_block"] = 30
-            score += 30
-            
-            # 가격이 OB 영역 내에 있으면 추가 점수
-            if current_price:
-                if ob_result.zone_bottom <= current_price <= ob_result.zone_top:
-                    details["price_in_zone"] += 10
-                    score += 10
-        
-        # 2. Fair Value Gap (+30점)
-        if fvg_result and fvg_result.found:
-            details["fvg"] = 30
-            score += 30
-            
-            # 가격이 FVG 영역 내에 있으면 추가 점수
-            if current_price:
-                if fvg_result.gap_bottom <= current_price <= fvg_result.gap_top:
-                    details["price_in_zone"] += 10
-                    score += 10
-        
-        # 3. Liquidity Pool (+20점)
-        if lp_result and lp_result.found:
-            details["liquidity_pool"] = 20
-            score += 20
+        score, d_ob, d_fvg, d_lp, d_zone, direction = confluence_score(
+            ob_found,
+            _DIRECTION_CODE.get(ob_result.direction, DIR_NONE) if ob_found else DIR_NONE,
+            ob_result.zone_bottom if ob_found else 0.0,
+            ob_result.zone_top if ob_found else 0.0,
+            fvg_found,
+            _DIRECTION_CODE.get(fvg_result.direction, DIR_NONE) if fvg_found else DIR_NONE,
+            fvg_result.gap_bottom if fvg_found else 0.0,
+            fvg_result.gap_top if fvg_found else 0.0,
+            bool(lp_result and lp_result.found),
+            current_price or 0.0
+        )
+        return score, ConfluenceDetails(d_ob, d_fvg, d_lp, d_zone), direction
+    
+    def calculate_confluence_score(
+        self,
+        ob_result,
+        fvg_result,
+        lp_result,
+        current_price: float = None
+    ) -> tuple:
+        """
+        Confluence 점수 계산
         
+        Returns:
+            (총점, ConfluenceDetails)
+        """
+        score, details, _ = self._confluence(
+            ob_result, fvg_result, lp_result, current_price
+        )
         return score, details
     
     def analyze(
@@ -269,6 +379,8 @@ class ICTStrategy(BaseStrategy):
         ob_result=None,
         fvg_result=None,
         lp_result=None,
+        indicators: Optional[dict] = None,
+        symbol: str = None,
         **kwargs
     ) -> Signal:
         """
@@ -282,23 +394,15 @@ class ICTStrategy(BaseStrategy):
             ob_result: OrderBlockResult (사전 계산된 경우)
             fvg_result: FVGResult (사전 계산된 경우)
             lp_result: LiquidityPoolResult (사전 계산된 경우)
+            indicators: ohlcv_df의 지표 항목 (indicator_panel 원소, 없으면 공유 캐시 사용)
+            symbol: 종목 (공유 지표 캐시 키, 없으면 캐시하지 않음)
             
         Returns:
             Signal
         """
-        from indicators import (
-            detect_order_block, detect_fvg, detect_liquidity_pool,
-            OrderBlockResult, FVGResult, LiquidityPoolResult
-        )
-        
         # 현재가 체크
         if current_price is None:
-            return Signal(
-                action="HOLD",
-                strategy=self.name,
-                confidence=0.0,
-                reason="현재가 정보 없음"
-            )
+            return self._HOLD_NO_PRICE
         
         # 포지션 보유 중인 경우 - 익절/손절 판단
         if in_position and entry_price and entry_price > 0:
@@ -310,7 +414,7 @@ class ICTStrategy(BaseStrategy):
                     action="SELL",
                     strategy=self.name,
                     confidence=0.95,
-                    reason=f"익절: +{profit_rate:.2f}% (목표: {self.take_profit}%)"
+                    reason=self._REASON_TAKE_PROFIT.format(profit_rate, self.take_profit)
                 )
             
             # 손절 (-1% 이하)
@@ -319,7 +423,7 @@ class ICTStrategy(BaseStrategy):
                     action="SELL",
                     strategy=self.name,
                     confidence=0.95,
-                    reason=f"손절: {profit_rate:.2f}% (한도: -{self.stop_loss}%)"
+                    reason=self._REASON_STOP_LOSS.format(profit_rate, self.stop_loss)
                 )
             
             # 포지션 유지
@@ -327,43 +431,47 @@ class ICTStrategy(BaseStrategy):
                 action="HOLD",
                 strategy=self.name,
                 confidence=0.6,
-                reason=f"포지션 유지: {profit_rate:+.2f}% (익절: +{self.take_profit}%, 손절: -{self.stop_loss}%)"
+                reason=f"포지션 유지: {profit_rate:+.2f}" + self._hold_suffix
             )
         
         # 포지션 없는 경우 - ICT 분석
         if ohlcv_df is None:
-            return Signal(
-                action="HOLD",
-                strategy=self.name,
-                confidence=0.0,
-                reason="OHLCV 데이터 없음"
-            )
+            return self._HOLD_NO_DATA
+        
+        # ICT 지표 계산 (사전 계산되지 않은 경우, 같은 봉 데이터는 캐시 재사용)
+        entry = indicators
+        if entry is None and (ob_result is None or fvg_result is None or lp_result is None):
+            entry = _indicator_cache_entry(ohlcv_df, symbol)
         
-        # ICT 지표 계산 (사전 계산되지 않은 경우)
         if ob_result is None:
-            ob_result = detect_order_block(ohlcv_df)
+            ob_result = entry.get("ob")
+            if ob_result is None:
+                ob_result = entry["ob"] = detect_order_block(ohlcv_df)
+        
         if fvg_result is None:
-            fvg_result = detect_fvg(ohlcv_df, min_gap_percent=0.05)
+            fvg_result = entry.get(("fvg", 0.05))
+            if fvg_result is None:
+                fvg_result = entry[("fvg", 0.05)] = detect_fvg(ohlcv_df, min_gap_percent=0.05)
+        
         if lp_result is None:
-            lp_result = detect_liquidity_pool(ohlcv_df)
+            lp_result = entry.get("lp")
+            if lp_result is None:
+                lp_result = entry["lp"] = detect_liquidity_pool(ohlcv_df)
         
         # Confluence 점수 계산
-        score, details = self.calculate_confluence_score(
+        score, details, direction = self._confluence(
             ob_result, fvg_result, lp_result, current_price
         )
         
-        logger.debug(f"ICT Score: {score} (OB:{details['order_block']}, FVG:{details['fvg']}, LP:{details['liquidity_pool']}, Zone:{details['price_in_zone']})")
+        logger.debug(
+            "ICT Score: {} (OB:{}, FVG:{}, LP:{}, Zone:{})",
+            score, details.order_block, details.fvg, details.liquidity_pool, details.price_in_zone
+        )
         
         # Bullish 신호 체크
         if score >= self.confluence_threshold:
-            # 방향 결정 (OB 또는 FVG 방향 기준)
-            direction = "BULLISH"
-            if ob_result and ob_result.found:
-                direction = ob_result.direction
-            elif fvg_result and fvg_result.found:
-                direction = fvg_result.direction
-            
-            if direction == "BULLISH":
+            # 방향 (OB 또는 FVG 방향 기준, 커널에서 결정)
+            if direction == DIR_BULLISH:
                 # 손익비 계산
                 stop_loss_price = current_price * (1 - self.stop_loss / 100)
                 take_profit_price = current_price * (1 + self.take_profit / 100)
@@ -372,28 +480,32 @@ class ICTStrategy(BaseStrategy):
                 rr_ratio = reward / risk if risk > 0 else 0
                 
                 if rr_ratio >= self.min_rr_ratio:
-                    confidence = min(0.95, 0.7 + (score - 80) * 0.01)
+                    confidence = 0.7 + (score - 80) * 0.01
+                    if confidence > 0.95:
+                        confidence = 0.95
                     return Signal(
                         action="BUY",
                         strategy=self.name,
                         confidence=confidence,
-                        reason=f"ICT Confluence {score}점 (OB:{details['order_block']}, FVG:{details['fvg']}, LP:{details['liquidity_pool']}) RR:{rr_ratio:.1f}"
+                        reason=self._REASON_BUY.format(
+                            score, details.order_block, details.fvg, details.liquidity_pool, rr_ratio
+                        )
                     )
                 else:
                     return Signal(
                         action="HOLD",
                         strategy=self.name,
                         confidence=0.5,
-                        reason=f"점수 충족({score}점) but 손익비 부족 (RR:{rr_ratio:.1f} < {self.min_rr_ratio})"
+                        reason=self._REASON_LOW_RR.format(score, rr_ratio, self.min_rr_ratio)
                     )
             
-            elif direction == "BEARISH":
+            elif direction == DIR_BEARISH:
                 # 하락 신호는 매도용 (현재는 BUY 봇이므로 HOLD)
                 return Signal(
                     action="HOLD",
                     strategy=self.name,
                     confidence=0.4,
-                    reason=f"ICT Bearish 신호 ({score}점) - 매수 대기"
+                    reason=self._REASON_BEARISH.format(score)
                 )
         
         # 점수 미달
@@ -401,7 +513,10 @@ class ICTStrategy(BaseStrategy):
             action="HOLD",
             strategy=self.name,
             confidence=0.3,
-            reason=f"Confluence {score}점 < {self.confluence_threshold}점 (OB:{details['order_block']}, FVG:{details['fvg']}, LP:{details['liquidity_pool']})"
+            reason=self._REASON_BELOW.format(
+                score, self.confluence_threshold,
+                details.order_block, details.fvg, details.liquidity_pool
+            )
         )
 
 
@@ -4,18 +4,24 @@ CryptoBot Studio - Strategy Factory
 
 목표: 승률 70%+ 안정성 우선
 """
-from typing import Dict, List, Optional, Literal
+import asyncio
+import heapq
+from typing import Dict, List, Optional, Literal, TYPE_CHECKING
 from dataclasses import dataclass
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from loguru import logger
 
-from strategies import ICTStrategy, Signal
-from trend_analyzer import TrendFollowingAnalyzer, TrendSignal
 from market_analyzer import MarketAnalyzer, MarketState, VolatilityRegime, TrendRegime
 
+if TYPE_CHECKING:
+    from strategies import ICTStrategy
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class StrategyConfig:
-    """전략 설정"""
+    """전략 설정 (불변 - 해시 가능)"""
     name: str
     description: str
     confluence_threshold: int
@@ -26,8 +32,8 @@ class StrategyConfig:
     min_win_rate_target: float  # 최소 목표 승률
 
 
-# 사전 정의된 전략 프로파일 (70%+ 승률 목표)
-STRATEGY_PROFILES: Dict[str, StrategyConfig] = {
+# 사전 정의된 전략 프로파일 (70%+ 승률 목표, 읽기 전용)
+STRATEGY_PROFILES: "MappingProxyType[str, StrategyConfig]" = MappingProxyType({
     # 보수적: 높은 승률, 낮은 수익
     "CONSERVATIVE": StrategyConfig(
         name="CONSERVATIVE",
@@ -87,8 +93,48 @@ STRATEGY_PROFILES: Dict[str, StrategyConfig] = {
         position_size=0.15,
         min_win_rate_target=0.75
     )
+})
+
+# 시장 상황 (변동성, 추세) -> 전략 프로파일 이름
+_DECISION_TABLE: Dict[tuple, str] = {
+    # 고변동성 → 보수적 (비추세는 스킵 권장, 작은 포지션으로 진행)
+    (VolatilityRegime.HIGH, TrendRegime.STRONG_UP): "CONSERVATIVE",
+    (VolatilityRegime.HIGH, TrendRegime.WEAK_UP): "CONSERVATIVE",
+    (VolatilityRegime.HIGH, TrendRegime.RANGING): "CONSERVATIVE",
+    (VolatilityRegime.HIGH, TrendRegime.WEAK_DOWN): "CONSERVATIVE",
+    (VolatilityRegime.HIGH, TrendRegime.STRONG_DOWN): "CONSERVATIVE",
+    # 저변동성
+    (VolatilityRegime.LOW, TrendRegime.STRONG_UP): "BALANCED",
+    (VolatilityRegime.LOW, TrendRegime.WEAK_UP): "BALANCED",
+    (VolatilityRegime.LOW, TrendRegime.RANGING): "RANGING_MEAN_REVERSION",
+    (VolatilityRegime.LOW, TrendRegime.WEAK_DOWN): "CONSERVATIVE",
+    (VolatilityRegime.LOW, TrendRegime.STRONG_DOWN): "CONSERVATIVE",
+    # 중변동성 (기본)
+    (VolatilityRegime.MEDIUM, TrendRegime.STRONG_UP): "TREND_ONLY",
+    (VolatilityRegime.MEDIUM, TrendRegime.WEAK_UP): "BALANCED",
+    (VolatilityRegime.MEDIUM, TrendRegime.RANGING): "ICT_OPTIMIZED",
+    (VolatilityRegime.MEDIUM, TrendRegime.WEAK_DOWN): "CONSERVATIVE",
+    (VolatilityRegime.MEDIUM, TrendRegime.STRONG_DOWN): "CONSERVATIVE",
+}
+
+# 거래 스킵 권장 (고변동 비추세)
+_SKIP_WARN_KEYS = frozenset(
+    key for key in _DECISION_TABLE if key[0] == VolatilityRegime.HIGH and key[1] != TrendRegime.STRONG_UP
+)
+
+# 전략 인스턴스 캐시 (ICTStrategy는 설정 외 상태가 없어 프로파일별로 공유)
+_STRATEGY_CACHE: Dict[StrategyConfig, "ICTStrategy"] = {}
+
+# 변동성별 포지션 보정 배수 (고변동성일수록 작게)
+_VOL_ADJ: Dict[VolatilityRegime, float] = {
+    VolatilityRegime.HIGH: 0.5,
+    VolatilityRegime.MEDIUM: 1.0,
+    VolatilityRegime.LOW: 1.2,
 }
 
+# 공유 시장 분석기 (설정 외 상태 없음)
+_SHARED_ANALYZER = MarketAnalyzer()
+
 
 class StrategyFactory:
     """
@@ -97,55 +143,55 @@ class StrategyFactory:
     시장 상황에 따라 최적의 전략을 선택하고 생성합니다.
     """
     
-    def __init__(self):
-        self.market_analyzer = MarketAnalyzer()
-        self.current_strategy: Optional[ICTStrategy] = None
+    def __init__(self, market_analyzer: Optional[MarketAnalyzer] = None):
+        """
+        Args:
+            market_analyzer: 시장 분석기 (기본: 모듈 공유 인스턴스)
+        """
+        self.market_analyzer = market_analyzer or _SHARED_ANALYZER
+        self.current_strategy: Optional["ICTStrategy"] = None
         self.current_config: Optional[StrategyConfig] = None
+        # 마지막 시장 분석 결과: ((마지막 봉 시각, 봉 수, 마지막 종가), MarketState)
+        self._analyze_cache: Optional[tuple] = None
+    
+    def analyze_market(self, df) -> Optional[MarketState]:
+        """
+        시장 분석 (같은 봉 데이터면 마지막 결과 재사용)
+        """
+        key = (df.index[-1], len(df), df['close'].to_numpy()[-1])
+        cached = self._analyze_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        market_state = self.market_analyzer.analyze(df)
+        self._analyze_cache = (key, market_state)
+        return market_state
     
     def select_strategy_for_market(self, market_state: MarketState) -> StrategyConfig:
         """
         시장 상황에 맞는 전략 선택
         
         원칙: 70%+ 승률을 위해 불확실한 상황에서는 SKIP
+        (사전 계산된 _DECISION_TABLE 조회)
         """
-        volatility = market_state.volatility
-        trend = market_state.trend
-        
-        # 고변동성 → 보수적 또는 스킵
-        if volatility == VolatilityRegime.HIGH:
-            if trend in [TrendRegime.STRONG_UP]:
-                return STRATEGY_PROFILES["CONSERVATIVE"]
-            else:
-                logger.info("⚠️ 고변동 비추세 시장 - 거래 스킵 권장")
-                return STRATEGY_PROFILES["CONSERVATIVE"]  # 작은 포지션으로 진행
-        
-        # 저변동성
-        if volatility == VolatilityRegime.LOW:
-            if trend == TrendRegime.RANGING:
-                return STRATEGY_PROFILES["RANGING_MEAN_REVERSION"]
-            elif trend in [TrendRegime.STRONG_UP, TrendRegime.WEAK_UP]:
-                return STRATEGY_PROFILES["BALANCED"]
-            else:
-                return STRATEGY_PROFILES["CONSERVATIVE"]
-        
-        # 중변동성 (기본)
-        if trend == TrendRegime.STRONG_UP:
-            return STRATEGY_PROFILES["TREND_ONLY"]
-        elif trend == TrendRegime.RANGING:
-            return STRATEGY_PROFILES["ICT_OPTIMIZED"]
-        elif trend in [TrendRegime.WEAK_UP]:
-            return STRATEGY_PROFILES["BALANCED"]
-        else:
-            return STRATEGY_PROFILES["CONSERVATIVE"]
+        key = (market_state.volatility, market_state.trend)
+        if key in _SKIP_WARN_KEYS:
+            logger.info("⚠️ 고변동 비추세 시장 - 거래 스킵 권장")
+        return STRATEGY_PROFILES[_DECISION_TABLE[key]]
     
-    def create_strategy(self, config: StrategyConfig) -> ICTStrategy:
-        """전략 인스턴스 생성"""
-        return ICTStrategy(
-            confluence_threshold=config.confluence_threshold,
-            min_rr_ratio=config.min_rr_ratio,
-            take_profit=config.take_profit,
-            stop_loss=config.stop_loss
-        )
+    def create_strategy(self, config: StrategyConfig) -> "ICTStrategy":
+        """전략 인스턴스 반환 (같은 설정이면 캐시된 인스턴스 재사용)"""
+        strategy = _STRATEGY_CACHE.get(config)
+        if strategy is None:
+            from strategies import ICTStrategy
+            
+            strategy = _STRATEGY_CACHE[config] = ICTStrategy(
+                confluence_threshold=config.confluence_threshold,
+                min_rr_ratio=config.min_rr_ratio,
+                take_profit=config.take_profit,
+                stop_loss=config.stop_loss
+            )
+        return strategy
     
     def get_optimal_strategy(self, df) -> tuple:
         """
@@ -154,7 +200,7 @@ class StrategyFactory:
         Returns:
             (ICTStrategy, StrategyConfig, MarketState)
         """
-        market_state = self.market_analyzer.analyze(df)
+        market_state = self.analyze_market(df)
         
         if market_state is None:
             # 기본 전략 반환
@@ -163,15 +209,20 @@ class StrategyFactory:
             return strategy, config, None
         
         config = self.select_strategy_for_market(market_state)
-        strategy = self.create_strategy(config)
         
-        self.current_strategy = strategy
-        self.current_config = config
+        # 선택된 전략이 바뀐 경우에만 교체
+        if config is not self.current_config:
+            self.current_strategy = self.create_strategy(config)
+            self.current_config = config
         
-        logger.info(f"🎯 전략 선택: {config.name} ({config.description})")
-        logger.debug(f"   시장: {market_state.volatility.value} / {market_state.trend.value}")
+        logger.info("🎯 전략 선택: {} ({})", config.name, config.description)
+        logger.opt(lazy=True).debug(
+            "   시장: {} / {}",
+            lambda: market_state.volatility.value,
+            lambda: market_state.trend.value
+        )
         
-        return strategy, config, market_state
+        return self.current_strategy, config, market_state
     
     def get_position_size(self, capital: float, config: StrategyConfig, market_state: MarketState = None) -> float:
         """
@@ -179,26 +230,47 @@ class StrategyFactory:
         
         시장 상황에 따라 포지션 크기 조정
         """
-        base_size = capital * config.position_size
+        mult = config.position_size
         
         if market_state:
-            # 시장 분석기의 배수 적용
-            base_size *= market_state.position_size_multiplier
-            
-            # 고변동성일수록 더 작게
-            if market_state.volatility == VolatilityRegime.HIGH:
-                base_size *= 0.5
-            elif market_state.volatility == VolatilityRegime.LOW:
-                base_size *= 1.2
+            # 시장 분석기의 배수 x 변동성 보정 배수
+            mult *= market_state.position_size_multiplier * _VOL_ADJ.get(market_state.volatility, 1.0)
         
-        return base_size
+        return capital * mult
+
+
+def _run_symbol_backtests(engine, df, symbol: str) -> list:
+    """
+    종목 1개의 전체 프로파일 백테스트 (프로세스 풀에서 호출 가능한 최상위 함수)
+    
+    봉별 ICT 지표는 종목당 한 번만 계산하고 모든 프로파일이 재사용합니다.
+    """
+    from strategies import indicator_panel
+    
+    panel = indicator_panel(df)
+    factory = StrategyFactory()
+    results = []
+    
+    for profile_name, config in STRATEGY_PROFILES.items():
+        strategy = factory.create_strategy(config)
+        result = engine.run_backtest(
+            df, strategy, position_size_ratio=config.position_size, panel=panel
+        )
+        result.params["profile"] = profile_name
+        result.params["symbol"] = symbol
+        results.append(result)
+    
+    return results
 
 
-def run_january_2026_backtest():
+def run_january_2026_backtest(max_workers: Optional[int] = None):
     """
     2026년 1월 백테스트 실행
     
     다중 전략 비교 및 최적 파라미터 탐색
+    
+    Args:
+        max_workers: 병렬 프로세스 수 (None: CPU 코어 수, 1: 순차 실행)
     """
     import pyupbit
     from optimizer import BacktestEngine, ParameterOptimizer
@@ -214,60 +286,84 @@ def run_january_2026_backtest():
         slippage_rate=0.002
     )
     
+    factory = StrategyFactory()
     results = []
     
-    for symbol in symbols:
+    # 1. 데이터 동시 조회 (네트워크 대기 중첩) + 시장 분석
+    # 1월 데이터 (약 27일 * 24시간 = 648캔들, API 제한으로 200개)
+    async def _fetch_all():
+        return await asyncio.gather(*[
+            asyncio.to_thread(pyupbit.get_ohlcv, symbol, interval="minute60", count=200)
+            for symbol in symbols
+        ])
+    
+    data = {}
+    for symbol, df in zip(symbols, asyncio.run(_fetch_all())):
         print(f"\n📌 {symbol} 분석 중...")
         
-        # 1월 데이터 (약 27일 * 24시간 = 648캔들, API 제한으로 200개)
-        df = pyupbit.get_ohlcv(symbol, interval="minute60", count=200)
-        
         if df is None:
             print(f"   ❌ 데이터 조회 실패")
             continue
+        data[symbol] = df
         
-        # 시장 분석
-        analyzer = MarketAnalyzer()
-        market_state = analyzer.analyze(df)
+        # 시장 분석 (종목당 1회 - 모든 프로파일이 결과 공유)
+        market_state = factory.analyze_market(df)
         
         if market_state:
             print(f"\n   📈 시장 상태:")
             print(f"   {market_state}")
+    
+    # 2. 종목별 백테스트 (종목 안에서는 프로파일들이 지표 공유) - 프로세스 풀로 GIL 우회
+    per_symbol = []
+    
+    if max_workers != 1 and len(data) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                per_symbol = list(executor.map(
+                    _run_symbol_backtests,
+                    repeat(engine),
+                    data.values(),
+                    data.keys()
+                ))
+        except Exception as e:
+            logger.error(f"병렬 백테스트 실패, 순차 실행으로 전환: {e}")
+            per_symbol = []
+    
+    if not per_symbol:
+        per_symbol = [
+            _run_symbol_backtests(engine, df, symbol)
+            for symbol, df in data.items()
+        ]
+    
+    tasks = [(symbol, profile_name) for symbol in data for profile_name in STRATEGY_PROFILES]
+    backtests = [result for results in per_symbol for result in results]
+    
+    # 3. 결과 출력 (종목 순서 유지)
+    current_symbol = None
+    for (symbol, profile_name), result in zip(tasks, backtests):
+        if symbol != current_symbol:
+            current_symbol = symbol
+            print(f"\n   🧪 {symbol} 전략별 백테스트:")
         
-        # 여러 전략 프로파일 테스트
-        print(f"\n   🧪 전략별 백테스트:")
+        # 승률 70% 이상만 표시
+        if result.win_rate >= 0.70 or result.total_trades == 0:
+            status = "✅" if result.win_rate >= 0.70 else "⏸️"
+        else:
+            status = "❌"
         
-        for profile_name, config in STRATEGY_PROFILES.items():
-            strategy = ICTStrategy(
-                confluence_threshold=config.confluence_threshold,
-                min_rr_ratio=config.min_rr_ratio,
-                take_profit=config.take_profit,
-                stop_loss=config.stop_loss
-            )
-            
-            result = engine.run_backtest(df, strategy, position_size_ratio=config.position_size)
-            result.params["profile"] = profile_name
-            result.params["symbol"] = symbol
-            
-            # 승률 70% 이상만 표시
-            if result.win_rate >= 0.70 or result.total_trades == 0:
-                status = "✅" if result.win_rate >= 0.70 else "⏸️"
-            else:
-                status = "❌"
-            
-            print(f"   {status} {profile_name}: 승률 {result.win_rate:.1%}, 수익 {result.total_profit_pct:+.2f}%, 거래 {result.total_trades}회")
-            
-            if result.total_trades > 0:
-                results.append({
-                    "symbol": symbol,
-                    "profile": profile_name,
-                    "win_rate": result.win_rate,
-                    "profit": result.total_profit_pct,
-                    "trades": result.total_trades,
-                    "sharpe": result.sharpe_ratio,
-                    "sortino": result.sortino_ratio,
-                    "max_dd": result.max_drawdown_pct
-                })
+        print(f"   {status} {profile_name}: 승률 {result.win_rate:.1%}, 수익 {result.total_profit_pct:+.2f}%, 거래 {result.total_trades}회")
+        
+        if result.total_trades > 0:
+            results.append({
+                "symbol": symbol,
+                "profile": profile_name,
+                "win_rate": result.win_rate,
+                "profit": result.total_profit_pct,
+                "trades": result.total_trades,
+                "sharpe": result.sharpe_ratio,
+                "sortino": result.sortino_ratio,
+                "max_dd": result.max_drawdown_pct
+            })
     
     # 요약
     print("\n" + "=" * 60)
@@ -277,11 +373,11 @@ def run_january_2026_backtest():
     high_winrate = [r for r in results if r["win_rate"] >= 0.70]
     
     if high_winrate:
-        # 승률 높은 순 정렬
-        high_winrate.sort(key=lambda x: (x["win_rate"], x["profit"]), reverse=True)
+        # 승률 높은 순 상위 5개 (전체 정렬 없이 선택)
+        top5 = heapq.nlargest(5, high_winrate, key=lambda x: (x["win_rate"], x["profit"]))
         
         print("\n🏆 Top 5 고승률 전략:")
-        for i, r in enumerate(high_winrate[:5], 1):
+        for i, r in enumerate(top5, 1):
             print(f"   {i}. {r['symbol']} - {r['profile']}")
             print(f"      승률: {r['win_rate']:.1%}, 수익: {r['profit']:+.2f}%, 거래: {r['trades']}회")
     else:
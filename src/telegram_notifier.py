@@ -3,15 +3,100 @@ CryptoBot Studio - Telegram Notifier
 Sends trading alerts and reports to Telegram
 """
 import asyncio
+import importlib.util
+import time
 from datetime import datetime
-from typing import Dict, Optional
+from string import Template
+from typing import Dict, Optional, Tuple
 import pytz
 from telegram import Bot
 from telegram.error import TelegramError
+from telegram.request import HTTPXRequest
 
 from config import settings
 
 
+# HTTP/2는 h2 패키지(httpx[http2])가 있을 때만 사용 (없으면 HTTP/1.1 keep-alive)
+_HTTP_VERSION = "2" if importlib.util.find_spec("h2") is not None else "1.1"
+
+
+# 마켓 심볼 -> 티커 캐시 (KRW-BTC -> BTC)
+_TICKER_CACHE: Dict[str, str] = {}
+
+
+def _ticker(symbol: str) -> str:
+    """마켓 심볼에서 티커 추출 (캐시)"""
+    ticker = _TICKER_CACHE.get(symbol)
+    if ticker is None:
+        ticker = _TICKER_CACHE[symbol] = symbol.partition('-')[2]
+    return ticker
+
+
+# 알림 이모지/문구 조회 테이블
+_ACTION_LABEL = {"BUY": ("🟢", "매수")}  # 그 외 액션은 매도 표기
+_SELL_LABEL = ("🔴", "매도")
+_PROFIT_EMOJI = ("📉", "📈")  # (수익률 >= 0) 인덱스
+
+
+# 메시지 템플릿 (설정값 등 고정 부분은 모듈 로드 시 1회 포맷, 호출 시에는 $변수만 치환)
+_DAILY_REPORT_TMPL = Template(f"""
+📊 <b>일일 거래 리포트</b>
+━━━━━━━━━━━━━━━━━━━━━
+📅 날짜: $date
+
+💹 <b>거래 실적</b>
+• 총 거래: $total_trades회
+• 승/패: $win_count승 $loss_count패
+• 승률: $win_rate%
+
+💰 <b>수익 현황</b>
+• 총 투자: ₩$total_wagered
+$profit_emoji 손익: ₩$total_profit
+
+🎯 <b>하이브리드 전략</b>
+• ICT(30%): 고승률, 목표 +{settings.ict_take_profit}%
+• Trend(15%): 고빈도, 목표 +{settings.trend_take_profit}%
+━━━━━━━━━━━━━━━━━━━━━
+""".strip())
+
+_STARTUP_TMPL = Template(f"""
+🚀 <b>CryptoBot Studio 시작</b>
+━━━━━━━━━━━━━━━━━━━━━
+⚙️ 모드: $mode_str
+📊 거래 대상 (BTC 제외):
+$tickers_str
+💰 포지션 크기: ICT 30%, Trend 15%
+
+🎯 <b>하이브리드 전략 (ICT + Trend)</b>
+• ICT: Confluence 50점+, 익절 +{settings.ict_take_profit}%
+• Trend: RSI+EMA 스캘핑, 익절 +{settings.trend_take_profit}%
+• 목표: 일 1% 수익 달성 시 보수적 운용
+
+🛡️ <b>리스크 관리</b>
+• 일일 최대 거래: {settings.max_daily_trades}회
+• 일일 손실 한도: ₩{settings.max_daily_loss:,.0f}
+
+🕐 시작 시각: $now
+━━━━━━━━━━━━━━━━━━━━━
+""".strip())
+
+_SHUTDOWN_TMPL = Template("""
+⏹️ <b>CryptoBot Studio 종료</b>
+━━━━━━━━━━━━━━━━━━━━━
+📝 사유: $reason
+🕐 시각: $now
+━━━━━━━━━━━━━━━━━━━━━
+""".strip())
+
+_ERROR_TMPL = Template("""
+⚠️ <b>에러 발생</b>
+━━━━━━━━━━━━━━━━━━━━━
+❌ $error
+🕐 시각: $now
+━━━━━━━━━━━━━━━━━━━━━
+""".strip())
+
+
 class TelegramNotifier:
     """
     텔레그램 알림 발송
@@ -20,12 +105,26 @@ class TelegramNotifier:
     - 일일 리포트
     - 시작/종료 알림
     - 에러 알림
+    
+    메시지는 큐에 쌓였다가 백그라운드 태스크가 짧은 구간(BATCH_WINDOW) 단위로 모아
+    등록 순서대로 하나씩 발송합니다 (같은 채팅방 - 순서 보장, 429 방지).
+    직전에 발송한 메시지와 같은 내용이 DEDUP_WINDOW 안에 연속되면 발송하지 않습니다.
+    
+    send_* 메서드의 반환값은 발송 성공이 아니라 큐 등록 여부입니다.
+    실제 발송 실패는 백그라운드 태스크가 터미널에 출력합니다.
     """
     
+    BATCH_WINDOW = 0.15  # 메시지 모으는 구간 (초)
+    MAX_BATCH = 20  # 한 번에 발송할 최대 메시지 수
+    DEDUP_WINDOW = 60.0  # 연속 중복 메시지 무시 구간 (초)
+    
     def __init__(self):
         self.bot: Optional[Bot] = None
         self.chat_id = settings.telegram_chat_id
         self.timezone = pytz.timezone(settings.timezone)
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._last_sent: Optional[Tuple[str, float]] = None  # (마지막 발송 메시지, 발송 시각)
     
     def get_now(self) -> datetime:
         """KST 현재 시간 반환"""
@@ -41,7 +140,14 @@ class TelegramNotifier:
     async def start(self):
         """Initialize Telegram bot"""
         try:
-            self.bot = Bot(token=settings.telegram_bot_token)
+            # 연결 풀 유지 (메시지마다 TLS 핸드셰이크 방지)
+            request = HTTPXRequest(
+                connection_pool_size=self.MAX_BATCH,
+                http_version=_HTTP_VERSION
+            )
+            self.bot = Bot(token=settings.telegram_bot_token, request=request)
+            self._queue = asyncio.Queue()
+            self._flusher_task = asyncio.create_task(self._flush_loop())
             # 시작 시 로그는 터미널에만 남김 (순환 호출 방지)
             print("📱 Telegram 봇 초기화 완료")
         except Exception as e:
@@ -49,8 +155,55 @@ class TelegramNotifier:
             self.bot = None
     
     async def close(self):
-        """Cleanup"""
-        pass
+        """Cleanup (대기 중인 메시지 발송 후 백그라운드 태스크 종료)"""
+        if self._flusher_task is None:
+            return
+        
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=10)
+        except asyncio.TimeoutError:
+            print("❌ Telegram 대기 메시지 발송 시간 초과")
+        
+        self._flusher_task.cancel()
+        try:
+            await self._flusher_task
+        except asyncio.CancelledError:
+            pass
+        self._flusher_task = None
+        
+        # 연결 풀 정리
+        if self.bot:
+            try:
+                await self.bot.shutdown()
+            except Exception as e:
+                print(f"❌ Telegram 봇 종료 실패: {e}")
+    
+    def _is_duplicate(self, message: str) -> bool:
+        """직전 발송 메시지와 같은 내용을 DEDUP_WINDOW 안에 다시 보내는지 확인"""
+        last = self._last_sent
+        return (
+            last is not None
+            and last[0] == message
+            and time.monotonic() - last[1] < self.DEDUP_WINDOW
+        )
+    
+    async def _flush_loop(self):
+        """큐의 메시지를 BATCH_WINDOW 단위로 모아 등록 순서대로 발송"""
+        while True:
+            batch = [await self._queue.get()]
+            await asyncio.sleep(self.BATCH_WINDOW)
+            while len(batch) < self.MAX_BATCH and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            # 같은 채팅방이므로 동시 발송하지 않음 (순서 뒤섞임, 429 Flood 제한)
+            for message, parse_mode in batch:
+                try:
+                    await self._send_now(message, parse_mode)
+                except Exception as e:
+                    # TelegramError 외 예외도 다음 메시지 발송은 계속
+                    print(f"❌ Telegram 발송 실패: {e}")
+                finally:
+                    self._queue.task_done()
     
     async def send_message(
         self,
@@ -58,17 +211,43 @@ class TelegramNotifier:
         parse_mode: Optional[str] = "HTML"
     ) -> bool:
         """
-        메시지 발송
+        메시지 발송 (큐에 등록 - 백그라운드에서 모아서 순서대로 발송)
+        
+        Returns:
+            큐 등록 여부 (봇 미초기화 또는 직전 발송과 연속 중복이면 False).
+            발송 결과가 아님 - 발송 실패는 백그라운드 태스크가 출력.
+            백그라운드 태스크가 없으면 즉시 발송하고 발송 성공 여부 반환.
         """
         if not self.bot:
             return False
         
+        if self._is_duplicate(message):
+            return False
+        
+        if self._flusher_task is None:
+            return await self._send_now(message, parse_mode)
+        
+        self._queue.put_nowait((message, parse_mode))
+        return True
+    
+    async def _send_now(
+        self,
+        message: str,
+        parse_mode: Optional[str] = "HTML"
+    ) -> bool:
+        """
+        메시지 즉시 발송 (직전 발송과 연속 중복이면 생략, 발송 성공 시에만 기록)
+        """
+        if self._is_duplicate(message):
+            return False
+        
         try:
             await self.bot.send_message(
                 chat_id=self.chat_id,
                 text=message,
                 parse_mode=parse_mode
             )
+            self._last_sent = (message, time.monotonic())
             return True
         except TelegramError as e:
             # 텔레그램 발송 실패 시 터미널에만 출력 (순환 참조 방지)
@@ -89,7 +268,7 @@ class TelegramNotifier:
         """
         매수 체결 알림
         """
-        ticker = symbol.split('-')[1]  # KRW-BTC -> BTC
+        ticker = _ticker(symbol)  # KRW-BTC -> BTC
         message = f"🟢 [{ticker}] 매수: ₩{price:,.0f} (금액: ₩{amount:,.0f})"
         return await self.send_message(message, parse_mode=None)
     
@@ -109,13 +288,13 @@ class TelegramNotifier:
         """
         매도 체결 알림
         """
-        ticker = symbol.split('-')[1]  # KRW-BTC -> BTC
+        ticker = _ticker(symbol)  # KRW-BTC -> BTC
         rate_str = "0%"
         if profit_rate is not None:
              sign = "+" if profit_rate >= 0 else ""
              rate_str = f"{sign}{profit_rate:.2f}%"
         
-        emoji = "📈" if profit_rate and profit_rate >= 0 else "📉"
+        emoji = _PROFIT_EMOJI[bool(profit_rate and profit_rate >= 0)]
         message = f"🔴 [{ticker}] 매도: ₩{price:,.0f} ({emoji} {rate_str})"
         return await self.send_message(message, parse_mode=None)
     
@@ -136,27 +315,18 @@ class TelegramNotifier:
         total_wagered = stats.get('total_wagered', 0)
         win_rate = (win_count / total_trades * 100) if total_trades > 0 else 0
         
-        profit_emoji = "📈" if total_profit >= 0 else "📉"
+        profit_emoji = _PROFIT_EMOJI[total_profit >= 0]
         
-        message = f"""
-📊 <b>일일 거래 리포트</b>
-━━━━━━━━━━━━━━━━━━━━━
-📅 날짜: {self.get_now().strftime('%Y-%m-%d')}
-
-💹 <b>거래 실적</b>
-• 총 거래: {total_trades}회
-• 승/패: {win_count}승 {loss_count}패
-• 승률: {win_rate:.1f}%
-
-💰 <b>수익 현황</b>
-• 총 투자: ₩{total_wagered:,.0f}
-{profit_emoji} 손익: ₩{total_profit:+,.0f}
-
-🎯 <b>하이브리드 전략</b>
-• ICT(30%): 고승률, 목표 +{settings.ict_take_profit}%
-• Trend(15%): 고빈도, 목표 +{settings.trend_take_profit}%
-━━━━━━━━━━━━━━━━━━━━━
-        """.strip()
+        message = _DAILY_REPORT_TMPL.substitute(
+            date=self.get_now().strftime('%Y-%m-%d'),
+            total_trades=total_trades,
+            win_count=win_count,
+            loss_count=loss_count,
+            win_rate=f"{win_rate:.1f}",
+            total_wagered=f"{total_wagered:,.0f}",
+            profit_emoji=profit_emoji,
+            total_profit=f"{total_profit:+,.0f}"
+        )
         
         return await self.send_message(message)
     
@@ -176,50 +346,29 @@ class TelegramNotifier:
         else:
             tickers_str = "(조회 중...)"
         
-        message = f"""
-🚀 <b>CryptoBot Studio 시작</b>
-━━━━━━━━━━━━━━━━━━━━━
-⚙️ 모드: {mode_str}
-📊 거래 대상 (BTC 제외):
-{tickers_str}
-💰 포지션 크기: ICT 30%, Trend 15%
-
-🎯 <b>하이브리드 전략 (ICT + Trend)</b>
-• ICT: Confluence 50점+, 익절 +{settings.ict_take_profit}%
-• Trend: RSI+EMA 스캘핑, 익절 +{settings.trend_take_profit}%
-• 목표: 일 1% 수익 달성 시 보수적 운용
-
-🛡️ <b>리스크 관리</b>
-• 일일 최대 거래: {settings.max_daily_trades}회
-• 일일 손실 한도: ₩{settings.max_daily_loss:,.0f}
-
-🕐 시작 시각: {self.get_now().strftime('%Y-%m-%d %H:%M:%S')}
-━━━━━━━━━━━━━━━━━━━━━
-        """.strip()
+        message = _STARTUP_TMPL.substitute(
+            mode_str=mode_str,
+            tickers_str=tickers_str,
+            now=self.get_now().strftime('%Y-%m-%d %H:%M:%S')
+        )
         
         return await self.send_message(message)
     
     async def send_shutdown_message(self, reason: str = "정상 종료") -> bool:
         """봇 종료 알림"""
-        message = f"""
-⏹️ <b>CryptoBot Studio 종료</b>
-━━━━━━━━━━━━━━━━━━━━━
-📝 사유: {reason}
-🕐 시각: {self.get_now().strftime('%Y-%m-%d %H:%M:%S')}
-━━━━━━━━━━━━━━━━━━━━━
-        """.strip()
+        message = _SHUTDOWN_TMPL.substitute(
+            reason=reason,
+            now=self.get_now().strftime('%Y-%m-%d %H:%M:%S')
+        )
         
         return await self.send_message(message)
     
     async def send_error_alert(self, error: str) -> bool:
         """에러 알림"""
-        message = f"""
-⚠️ <b>에러 발생</b>
-━━━━━━━━━━━━━━━━━━━━━
-❌ {error}
-🕐 시각: {self.get_now().strftime('%Y-%m-%d %H:%M:%S')}
-━━━━━━━━━━━━━━━━━━━━━
-        """.strip()
+        message = _ERROR_TMPL.substitute(
+            error=error,
+            now=self.get_now().strftime('%Y-%m-%d %H:%M:%S')
+        )
         
         return await self.send_message(message)
     
@@ -247,9 +396,8 @@ class TelegramNotifier:
             gap_top: FVG 갭 상단
             stop_loss: 손절가
         """
-        ticker = symbol.split('-')[1]
-        emoji = "🟢" if action == "BUY" else "🔴"
-        action_kr = "매수" if action == "BUY" else "매도"
+        ticker = _ticker(symbol)
+        emoji, action_kr = _ACTION_LABEL.get(action, _SELL_LABEL)
         
         # FVG 정보
         fvg_info = ""
@@ -323,25 +471,33 @@ class TelegramNotifier:
         Args:
             market_states: {symbol: MarketState} 딕셔너리
         """
-        # 전체 시장 방향 판단
-        trends = []
+        # 한 번 순회로 추세 카운트 + 코인별 상태 작성
+        trend_count = up_count = down_count = 0
+        coin_status_lines = []
         for symbol, state in market_states.items():
-            if state:
-                trends.append(state.trend.value)
-        
-        # 하락 vs 상승 vs 횡보 카운트
-        up_count = sum(1 for t in trends if "UP" in t)
-        down_count = sum(1 for t in trends if "DOWN" in t)
-        ranging_count = sum(1 for t in trends if "RANGING" in t)
+            ticker = _ticker(symbol)
+            if not state:
+                coin_status_lines.append(f"• {ticker}: 데이터 없음")
+                continue
+            
+            trend = state.trend.value
+            trend_count += 1
+            if "UP" in trend:
+                up_count += 1
+            elif "DOWN" in trend:
+                down_count += 1
+            coin_status_lines.append(
+                f"• {ticker}: {trend} (변동성: {state.volatility.value}, RSI: {state.rsi:.1f})"
+            )
         
         # 전체 시장 판단
-        if down_count >= len(trends) // 2 + 1:
+        if down_count >= trend_count // 2 + 1:
             market_direction = "하락 추세"
             direction_emoji = "📉"
             recommendation = "SKIP (거래 미권장)"
             rec_emoji = "⛔"
             advice = "하락장에서 매수 전략은 손실 위험이 높습니다."
-        elif up_count >= len(trends) // 2 + 1:
+        elif up_count >= trend_count // 2 + 1:
             market_direction = "상승 추세"
             direction_emoji = "📈"
             recommendation = "ACTIVE (적극 거래)"
@@ -354,18 +510,6 @@ class TelegramNotifier:
             rec_emoji = "🟡"
             advice = "횡보장에서는 평균회귀 전략을 고려하세요."
         
-        # 개별 코인 상태
-        coin_status_lines = []
-        for symbol, state in market_states.items():
-            ticker = symbol.split('-')[1]
-            if state:
-                vol = state.volatility.value
-                trend = state.trend.value
-                rsi = state.rsi
-                coin_status_lines.append(f"• {ticker}: {trend} (변동성: {vol}, RSI: {rsi:.1f})")
-            else:
-                coin_status_lines.append(f"• {ticker}: 데이터 없음")
-        
         coin_status = "\n".join(coin_status_lines)
         
         message = f"""
@@ -403,7 +547,7 @@ async def test_notifier():
     if notifier.bot:
         # 시작 메시지 테스트
         result = await notifier.send_startup_message(mode="full")
-        print(f"시작 메시지: {'성공' if result else '실패'}")
+        print(f"시작 메시지 등록: {'성공' if result else '실패'}")
         
         # 매수 알림 테스트 (ICT FVG)
         result = await notifier.send_buy_alert(
@@ -416,9 +560,11 @@ async def test_notifier():
             stop_loss=140898000,
             strategy="ICT_FVG"
         )
-        print(f"매수 알림: {'성공' if result else '실패'}")
+        print(f"매수 알림 등록: {'성공' if result else '실패'}")
     else:
         print("❌ Telegram 봇 초기화 실패 (API 키 확인 필요)")
+    
+    await notifier.close()
 
 
 if __name__ == "__main__":
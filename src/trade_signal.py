@@ -2,11 +2,15 @@
 CryptoBot Studio - Unified Trade Signal
 모든 전략에서 사용하는 통합 신호 클래스
 """
-from dataclasses import dataclass, field
-from typing import Literal, Optional, Dict, Any
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, Dict, Literal, Optional
 
 
-@dataclass
+# 전용 필드로 저장하는 공통 메타데이터 키 (나머지는 metadata dict)
+_META_FIELDS = frozenset({"rsi", "ema_fast", "ema_slow", "volume", "confluence"})
+
+
+@dataclass(slots=True)
 class TradeSignal:
     """
     통합 거래 신호
@@ -14,6 +18,9 @@ class TradeSignal:
     모든 전략(ICT, Trend, Hybrid)에서 공통으로 사용하는 신호 클래스.
     기존 Signal, HybridSignal, TrendSignal을 통합.
     """
+    # 액션별 이모지 (그 외 액션은 HOLD 표기)
+    _EMOJI: ClassVar[Dict[str, str]] = {"BUY": "🟢", "SELL": "🔴", "HOLD": "⏸️"}
+    
     # 필수 필드
     action: Literal["BUY", "SELL", "HOLD"]
     strategy: str  # 전략 이름 (예: "ICT", "TREND", "HYBRID")
@@ -25,21 +32,27 @@ class TradeSignal:
     stop_loss: float = 0.0  # 손절 %
     position_size_ratio: float = 0.0  # 포지션 크기 비율
     
-    # 메타데이터 (RSI, EMA 등 전략별 추가 정보)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # 공통 지표 값 (dict 없이 고정 필드로 보관, 없으면 None)
+    rsi: Optional[float] = None
+    ema_fast: Optional[float] = None
+    ema_slow: Optional[float] = None
+    volume: Optional[float] = None
+    confluence: Optional[int] = None
+    
+    # 메타데이터 (그 외 전략별 추가 정보, 없으면 None - 첫 기록 시 생성)
+    metadata: Optional[Dict[str, Any]] = None
     
     def __str__(self) -> str:
-        emoji = "🟢" if self.action == "BUY" else "🔴" if self.action == "SELL" else "⏸️"
-        conf_str = f"{self.confidence:.0%}"
-        
+        emoji = self._EMOJI.get(self.action, "⏸️")
         if self.position_size_ratio > 0:
-            return f"{emoji} [{self.strategy}] {self.action}: {self.reason} (신뢰도: {conf_str}, 크기: {self.position_size_ratio:.1%})"
-        else:
-            return f"{emoji} [{self.strategy}] {self.action}: {self.reason} (신뢰도: {conf_str})"
+            return f"{emoji} [{self.strategy}] {self.action}: {self.reason} (신뢰도: {self.confidence:.0%}, 크기: {self.position_size_ratio:.1%})"
+        return f"{emoji} [{self.strategy}] {self.action}: {self.reason} (신뢰도: {self.confidence:.0%})"
     
     @classmethod
     def hold(cls, strategy: str = "NONE", reason: str = "대기") -> "TradeSignal":
-        """HOLD 신호 빠른 생성"""
+        """HOLD 신호 빠른 생성 (기본 인자면 공유 인스턴스 반환)"""
+        if cls is TradeSignal and strategy == "NONE" and reason == "대기":
+            return _HOLD_SENTINEL
         return cls(
             action="HOLD",
             strategy=strategy,
@@ -56,6 +69,11 @@ class TradeSignal:
         take_profit: float = 0.0,
         stop_loss: float = 0.0,
         position_size_ratio: float = 0.0,
+        rsi: Optional[float] = None,
+        ema_fast: Optional[float] = None,
+        ema_slow: Optional[float] = None,
+        volume: Optional[float] = None,
+        confluence: Optional[int] = None,
         **metadata
     ) -> "TradeSignal":
         """BUY 신호 빠른 생성"""
@@ -67,7 +85,12 @@ class TradeSignal:
             take_profit=take_profit,
             stop_loss=stop_loss,
             position_size_ratio=position_size_ratio,
-            metadata=metadata
+            rsi=rsi,
+            ema_fast=ema_fast,
+            ema_slow=ema_slow,
+            volume=volume,
+            confluence=confluence,
+            metadata=metadata or None
         )
     
     @classmethod
@@ -76,6 +99,11 @@ class TradeSignal:
         strategy: str,
         reason: str,
         confidence: float = 0.95,
+        rsi: Optional[float] = None,
+        ema_fast: Optional[float] = None,
+        ema_slow: Optional[float] = None,
+        volume: Optional[float] = None,
+        confluence: Optional[int] = None,
         **metadata
     ) -> "TradeSignal":
         """SELL 신호 빠른 생성"""
@@ -84,12 +112,62 @@ class TradeSignal:
             strategy=strategy,
             confidence=confidence,
             reason=reason,
-            metadata=metadata
+            rsi=rsi,
+            ema_fast=ema_fast,
+            ema_slow=ema_slow,
+            volume=volume,
+            confluence=confluence,
+            metadata=metadata or None
         )
     
     def get_meta(self, key: str, default: Any = None) -> Any:
-        """메타데이터 조회"""
+        """메타데이터 조회 (공통 키는 전용 필드에서)"""
+        if key in _META_FIELDS:
+            value = getattr(self, key)
+            return default if value is None else value
+        if self.metadata is None:
+            return default
         return self.metadata.get(key, default)
+    
+    def set_meta(self, key: str, value: Any):
+        """메타데이터 기록 (첫 기록 시 dict 생성)"""
+        if key in _META_FIELDS:
+            setattr(self, key, value)
+            return
+        if self.metadata is None:
+            self.metadata = {}
+        self.metadata[key] = value
+
+
+class _SharedHold(TradeSignal):
+    """
+    기본 HOLD 공유 인스턴스 전용 타입 (필드 변경 불가, 문자열은 생성 시 1회 포맷)
+    
+    TradeSignal은 frozen이 아니므로 공유 인스턴스만 변경을 막아
+    한 곳의 수정이 이후 모든 기본 HOLD 신호로 번지지 않게 합니다.
+    """
+    __slots__ = ()
+    
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("공유 HOLD 신호는 변경할 수 없습니다 (TradeSignal.hold(reason=...) 사용)")
+    
+    def __delattr__(self, name: str):
+        raise AttributeError("공유 HOLD 신호는 변경할 수 없습니다")
+    
+    def __str__(self) -> str:
+        return _HOLD_STR
+    
+    def __eq__(self, other) -> bool:
+        # 같은 값의 일반 TradeSignal과는 기존처럼 같음 (dataclass __eq__는 정확한 타입만 비교)
+        if not isinstance(other, TradeSignal):
+            return NotImplemented
+        return all(getattr(self, f.name) == getattr(other, f.name) for f in fields(TradeSignal))
+
+
+# 기본 HOLD 신호 (모듈 로드 시 1회 생성 후 변경 불가 타입으로 전환)
+_HOLD_SENTINEL = TradeSignal(action="HOLD", strategy="NONE", confidence=0.3, reason="대기")
+_HOLD_STR = str(_HOLD_SENTINEL)
+_HOLD_SENTINEL.__class__ = _SharedHold
 
 
 # 하위 호환용 별칭 (점진적 마이그레이션)
@@ -2,20 +2,21 @@
 CryptoBot Studio - Auto Trading Engine (Hybrid Strategy)
 ICT + Trend Following 하이브리드 전략으로 매일 1% 목표
 """
-from typing import Optional, Literal, Dict, List
-from dataclasses import dataclass
-from datetime import datetime
+import asyncio
+import time
+from typing import Optional, Literal, Dict, List, Tuple
+from dataclasses import dataclass, field
 from loguru import logger
 
 from config import settings
-from upbit_client import UpbitClient, OrderResult
+from upbit_client import UpbitClient, UpbitMarketStream, UpbitOrderStream, OrderResult
 from hybrid_strategy import HybridStrategy, HybridSignal
 from telegram_notifier import TelegramNotifier
 from risk_manager import RiskManager
 from market_analyzer import MarketAnalyzer
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeResult:
     """거래 결과"""
     success: bool
@@ -28,22 +29,51 @@ class TradeResult:
     volume: Optional[float]
     strategy_type: str = "UNKNOWN"
     error: Optional[str] = None
+    _str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __str__(self):
-        if self.success:
-            price_str = f"₩{self.price:,.0f}" if self.price else "N/A"
-            return f"✅ [{self.strategy_type}] {self.symbol} {self.action}: {price_str}"
-        return f"❌ [{self.strategy_type}] {self.symbol} {self.action}: {self.error}"
+        # 생성 후 변경되지 않으므로 첫 호출 시 1회만 포맷
+        if self._str is None:
+            if self.success:
+                price_str = f"₩{self.price:,.0f}" if self.price else "N/A"
+                self._str = f"✅ [{self.strategy_type}] {self.symbol} {self.action}: {price_str}"
+            else:
+                self._str = f"❌ [{self.strategy_type}] {self.symbol} {self.action}: {self.error}"
+        return self._str
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionInfo:
     """포지션 정보"""
-    in_position: bool
     entry_price: float
     balance: float
     strategy_type: str  # "ICT" or "TREND"
-    entry_time: datetime = None
+    entry_time: Optional[float] = None  # 진입 시각 (time.monotonic, 보유 시간 계산용)
+
+    @property
+    def in_position(self) -> bool:
+        """보유 여부 (잔고에서 바로 판단 - 별도 플래그를 두지 않음)"""
+        return self.balance > 0
+
+
+# 미보유 심볼 공용 객체 (읽기 전용 - positions 에 넣지 않음)
+_EMPTY_POSITION = PositionInfo(entry_price=0.0, balance=0.0, strategy_type="NONE")
+
+
+class _NullNotifier:
+    """알림 없음 (semi 모드 - 체결 알림을 보내지 않으므로 텔레그램 연결도 만들지 않음)"""
+    
+    async def start(self):
+        pass
+    
+    async def close(self):
+        pass
+    
+    async def send_buy_alert(self, **kwargs) -> bool:
+        return False
+    
+    async def send_sell_alert(self, **kwargs) -> bool:
+        return False
 
 
 class AutoTrader:
@@ -58,6 +88,13 @@ class AutoTrader:
     대상: ETH, USDT, SOL (BTC 제외 - DCA)
     """
     
+    MIN_ORDER_KRW = 5000  # 업비트 최소 주문 금액 (원) - 자투리 판정 기준
+    PRICE_MAX_AGE = 0.5  # 분석 시 조회한 현재가 재사용 한도 (초, 주문용)
+    PRICE_CACHE_TTL = 1.5  # 포지션 동기화(소액 판정)용 현재가 재사용 한도 (초)
+    KEEP_ALIVE_INTERVAL = 30  # REST 연결 유지 요청 주기 (초)
+    ANALYZE_CONCURRENCY = 8  # 동시에 분석(캔들 조회)하는 심볼 수 상한 (API 호출 제한 대비)
+    FILL_TIMEOUT = 2.0  # 주문 후 실제 체결값 대기 한도 (초, 초과 시 추정값 사용)
+    
     def __init__(
         self,
         mode: Literal["semi", "full"] = None,
@@ -68,7 +105,8 @@ class AutoTrader:
         
         # Components
         self.upbit = UpbitClient()
-        self.notifier = TelegramNotifier()
+        # 체결 알림은 full 모드 주문에서만 발생 (semi 모드는 연결 생략)
+        self.notifier = TelegramNotifier() if self.mode == "full" else _NullNotifier()
         self.risk_manager = RiskManager()
         
         # 하이브리드 전략
@@ -84,9 +122,44 @@ class AutoTrader:
         # 고정 거래 대상 (BTC 제외)
         self.target_symbols = [s.strip() for s in settings.ict_target_symbols.split(',')]
         
+        # 심볼 -> 기준 통화 (KRW-ETH -> ETH), 대상 심볼은 실행 중 바뀌지 않으므로 1회 계산
+        self._base_ccy: Dict[str, str] = {s: s.partition('-')[2] for s in self.target_symbols}
+        
+        # 제외 판정용 집합 (settings.exclude_symbols는 접근마다 문자열을 다시 파싱)
+        self._exclude_set = frozenset(settings.exclude_symbols)
+        
+        # 기준 통화 -> 동기화 대상 심볼 (잔고 항목마다 "KRW-" 문자열을 만들지 않고 바로 조회)
+        self._synced_symbol_of: Dict[str, str] = {
+            ccy: s for s, ccy in self._base_ccy.items() if s not in self._exclude_set
+        }
+        
+        # 매 사이클 분석할 심볼 (대상 고정이므로 BTC(시장 지표)/제외 심볼을 1회만 걸러 둠)
+        self._active_symbols: List[str] = [
+            s for s in self.target_symbols
+            if s != "KRW-BTC" and s not in self._exclude_set
+        ]
+        
         # 포지션 관리
         self.positions: Dict[str, PositionInfo] = {}
         
+        # 실시간 시세 스트림 (현재가를 REST 대신 WebSocket에서 읽음)
+        self.market_stream = UpbitMarketStream(self.target_symbols)
+        
+        # 내 주문 스트림 (주문 후 실제 평균 체결가/수량 수신)
+        self.order_stream = UpbitOrderStream(self.upbit.auth_headers)
+        
+        # 분석 시 조회한 현재가 (symbol -> (가격, 조회 시각))
+        self._last_prices: Dict[str, Tuple[float, float]] = {}
+        
+        # 심볼별 마지막 HOLD 결과 (같은 신호/가격이면 재사용 - 폴링마다 생성하지 않음)
+        self._hold_results: Dict[str, TradeResult] = {}
+        
+        # 주문 액션 -> 실행 함수 (HOLD는 execute_signal에서 먼저 처리)
+        self._handlers = {"BUY": self._execute_buy, "SELL": self._execute_sell}
+        
+        # REST 연결 유지 태스크 (주문 시 TLS 핸드셰이크 방지)
+        self._keep_alive_task: Optional[asyncio.Task] = None
+        
         mode_str = "🔔 알림 전용" if self.mode == "semi" else "🤖 자동매매"
         logger.info(f"💹 AutoTrader 초기화 (하이브리드 전략) - {mode_str}")
         logger.info(f"   - 대상: {', '.join(self.target_symbols)}")
@@ -95,78 +168,144 @@ class AutoTrader:
     async def start(self):
         """초기화"""
         await self.notifier.start()
+        await self.market_stream.start()
+        await self.order_stream.start()
+        self._keep_alive_task = asyncio.create_task(self._keep_alive_loop())
         await self._sync_positions()
     
     async def stop(self):
         """종료"""
+        if self._keep_alive_task is not None:
+            self._keep_alive_task.cancel()
+            try:
+                await self._keep_alive_task
+            except asyncio.CancelledError:
+                pass
+            self._keep_alive_task = None
+        await self.market_stream.close()
+        await self.order_stream.close()
         await self.notifier.close()
     
+    async def _keep_alive_loop(self):
+        """주기적으로 경량 요청을 보내 공유 HTTP 연결 유지"""
+        while True:
+            await asyncio.sleep(self.KEEP_ALIVE_INTERVAL)
+            await asyncio.to_thread(self.upbit.keep_alive)
+    
     def _is_dust(self, balance: float, price: float) -> bool:
         """자투리 코인 여부"""
-        return (balance * price) < 5000
+        return balance * price < self.MIN_ORDER_KRW
     
     async def _sync_positions(self):
         """포지션 동기화"""
         try:
-            balances = self.upbit.get_balances()
+            balances = await asyncio.to_thread(self.upbit.get_balances)
             if not balances:
                 return
             
-            self.positions.clear()
-            
+            # 대상 보유 종목만 추림
+            held: Dict[str, Tuple[float, float]] = {}  # symbol -> (잔고, 평균 매수가)
+            synced_symbol_of = self._synced_symbol_of
             for item in balances:
-                currency = item.get('currency', '')
-                if currency == 'KRW':
+                # KRW/대상 외/제외 심볼은 조회 결과 없음
+                symbol = synced_symbol_of.get(item.get('currency', ''))
+                if symbol is None:
                     continue
                 
-                symbol = f"KRW-{currency}"
-                
-                if symbol not in self.target_symbols:
-                    continue
+                held[symbol] = (
+                    float(item.get('balance', 0) or 0),
+                    float(item.get('avg_buy_price', 0) or 0)
+                )
+            
+            # 현재가: 스트림 -> 가격 캐시 -> 나머지는 한 번에 일괄 조회 (종목별 REST 호출 없음)
+            now = time.monotonic()
+            prices: Dict[str, float] = {}
+            missing = []
+            for symbol in held:
+                price = self.market_stream.get_price(symbol)
+                if price is None:
+                    cached = self._last_prices.get(symbol)
+                    if cached is not None and now - cached[1] <= self.PRICE_CACHE_TTL:
+                        price = cached[0]
+                if price is None:
+                    missing.append(symbol)
+                else:
+                    prices[symbol] = price
+            if missing:
+                fetched = await asyncio.to_thread(self.upbit.get_current_prices, missing)
+                now = time.monotonic()
+                for symbol, price in fetched.items():
+                    self._last_prices[symbol] = (price, now)
+                prices.update(fetched)
+            
+            # 새 딕셔너리를 만든 뒤 한 번에 교체 (잔고/평균가가 같은 포지션은 기존 객체 재사용)
+            old_positions = self.positions
+            positions: Dict[str, PositionInfo] = {}
+            
+            for symbol, (balance, avg_buy_price) in held.items():
+                # 현재가를 못 받으면 평균 매수가로 소액 판정
+                current_price = prices.get(symbol) or avg_buy_price
                 
-                if symbol in settings.exclude_symbols:
+                if self._is_dust(balance, current_price):
                     continue
                 
-                balance = float(item.get('balance', 0) or 0)
-                avg_buy_price = float(item.get('avg_buy_price', 0) or 0)
-                current_price = self.upbit.get_current_price(symbol) or avg_buy_price
-                
-                if self._is_dust(balance, current_price):
+                old = old_positions.get(symbol)
+                if (
+                    old is not None and old.in_position
+                    and old.balance == balance and old.entry_price == avg_buy_price
+                ):
+                    positions[symbol] = old
                     continue
                 
-                self.positions[symbol] = PositionInfo(
-                    in_position=True,
+                positions[symbol] = PositionInfo(
                     entry_price=avg_buy_price,
                     balance=balance,
                     strategy_type="UNKNOWN",  # 기존 포지션은 알 수 없음
-                    entry_time=datetime.now()
+                    entry_time=time.monotonic()
                 )
+            
+            self.positions = positions
                 
         except Exception as e:
             logger.error(f"포지션 동기화 실패: {e}")
     
     def _get_position(self, symbol: str) -> PositionInfo:
-        """포지션 조회"""
-        if symbol not in self.positions:
-            self.positions[symbol] = PositionInfo(
-                in_position=False,
-                entry_price=0.0,
-                balance=0.0,
-                strategy_type="NONE"
-            )
-        return self.positions[symbol]
+        """포지션 조회 (미보유 심볼은 공용 빈 포지션 반환 - 새로 만들지 않음)"""
+        return self.positions.get(symbol, _EMPTY_POSITION)
+    
+    def _clear_position(self, symbol: str):
+        """포지션 해제 (항목 제거 - 공용 빈 포지션은 수정하지 않음)"""
+        self.positions.pop(symbol, None)
     
-    def analyze(self, symbol: str) -> Optional[HybridSignal]:
-        """하이브리드 분석"""
-        # 1시간봉 (ICT용)
-        df_1h = self.upbit.get_ohlcv(symbol, interval="minute60", count=100)
-        # 5분봉 (추세용)
-        df_5m = self.upbit.get_ohlcv(symbol, interval="minute5", count=50)
-        
-        current_price = self.upbit.get_current_price(symbol)
+    async def analyze(self, symbol: str, current_price: Optional[float] = None) -> Optional[HybridSignal]:
+        """
+        하이브리드 분석 (REST 조회는 스레드에서 실행 - 이벤트 루프 비차단)
+        
+        Args:
+            symbol: 마켓 심볼
+            current_price: 미리 조회한 현재가 (없으면 스트림 값 또는 REST 조회)
+        """
+        # 현재가는 스트림 값 우선, 없거나 오래되면 REST 조회
+        if current_price is None:
+            current_price = self.market_stream.get_price(symbol)
+        if current_price is None:
+            current_price = await asyncio.to_thread(self.upbit.get_current_price, symbol)
         if current_price is None:
             return None
         
+        # 캔들은 새 봉이 생길 때만 재조회, 진행 중인 봉은 현재가로 갱신
+        df_1h, df_5m = await asyncio.gather(
+            asyncio.to_thread(
+                self.upbit.get_ohlcv, symbol, interval="minute60", count=100,
+                bar_aligned=True, live_price=current_price
+            ),  # ICT용
+            asyncio.to_thread(
+                self.upbit.get_ohlcv, symbol, interval="minute5", count=50,
+                bar_aligned=True, live_price=current_price
+            )  # 추세용
+        )
+        self._last_prices[symbol] = (current_price, time.monotonic())
+        
         position = self._get_position(symbol)
         
         signal = self.strategy.analyze(
@@ -175,23 +314,66 @@ class AutoTrader:
             current_price=current_price,
             in_position=position.in_position,
             entry_price=position.entry_price,
-            position_strategy=position.strategy_type
+            position_strategy=position.strategy_type,
+            symbol=symbol
         )
         
         if signal.action != "HOLD":
-            logger.info(f"🎯 {symbol} 신호: {signal}")
+            logger.info("🎯 {} 신호: {}", symbol, signal)
         else:
-            logger.debug(f"⏸️ {symbol}: {signal.reason}")
+            logger.debug("⏸️ {}: {}", symbol, signal.reason)
         
         return signal
     
+    async def _fresh_price(self, symbol: str, max_age: Optional[float] = None) -> Optional[float]:
+        """
+        현재가 (최근 조회값이 max_age 이내면 재사용, 아니면 재조회 후 기록)
+        
+        Args:
+            symbol: 마켓 심볼
+            max_age: 재사용 한도 (초, 기본 PRICE_MAX_AGE)
+        """
+        max_age = self.PRICE_MAX_AGE if max_age is None else max_age
+        cached = self._last_prices.get(symbol)
+        if cached is not None and time.monotonic() - cached[1] <= max_age:
+            return cached[0]
+        
+        price = await asyncio.to_thread(self.upbit.get_current_price, symbol)
+        if price is not None:
+            self._last_prices[symbol] = (price, time.monotonic())
+        return price
+    
     async def execute_signal(
         self,
         symbol: str,
-        signal: HybridSignal
+        signal: HybridSignal,
+        current_price: Optional[float] = None
     ) -> TradeResult:
-        """신호 실행"""
-        current_price = self.upbit.get_current_price(symbol)
+        """
+        신호 실행
+        
+        Args:
+            symbol: 마켓 심볼
+            signal: 실행할 신호
+            current_price: 분석에 사용한 현재가 (없으면 최근 조회값 또는 재조회)
+        """
+        # HOLD는 주문이 없으므로 현재가/잔고 조회 없이 바로 반환 (가격은 있는 값만 기록)
+        if signal.action == "HOLD":
+            if current_price is None:
+                cached = self._last_prices.get(symbol)
+                current_price = cached[0] if cached else None
+            hold = self._hold_results.get(symbol)
+            if hold is None or hold.signal is not signal or hold.price != current_price:
+                hold = TradeResult(
+                    success=True, action="HOLD", symbol=symbol,
+                    order=None, signal=signal, price=current_price,
+                    amount=None, volume=None, strategy_type=signal.strategy_type
+                )
+                self._hold_results[symbol] = hold
+            return hold
+        
+        if current_price is None:
+            current_price = await self._fresh_price(symbol)
         
         if current_price is None:
             return TradeResult(
@@ -200,22 +382,15 @@ class AutoTrader:
                 volume=None, strategy_type=signal.strategy_type, error="현재가 조회 실패"
             )
         
-        # 포지션 크기 계산
-        krw_balance = self.upbit.get_balance("KRW")
-        amount = krw_balance * signal.position_size_ratio
-        
-        # 최소 금액 체크
-        if amount < 5000:
-            amount = 5000
-        
-        if signal.action == "HOLD":
-            return TradeResult(
-                success=True, action="HOLD", symbol=symbol,
-                order=None, signal=signal, price=current_price,
-                amount=None, volume=None, strategy_type=signal.strategy_type
-            )
+        # 포지션 크기 계산 (매수만 - 매도는 보유 수량 전량이므로 KRW 잔고 불필요)
+        # 이번 사이클 동기화 때 받은 계좌 스냅샷 재사용, 주문 성공 시 무효화
+        amount = None
+        if signal.action == "BUY":
+            krw_balance = (await asyncio.to_thread(self.upbit.get_account, "KRW", self.check_interval))[0]
+            # 원 단위 정수 금액 (원 미만 단위 없음), 최소 주문 금액 보장
+            amount = max(int(krw_balance * signal.position_size_ratio), self.MIN_ORDER_KRW)
         
-        # 리스크 체크
+        # 리스크 체크 (매도도 호출 - 날짜 변경 시 일일 통계 리셋)
         can_trade, reason = self.risk_manager.can_trade(amount)
         if not can_trade and signal.action == "BUY":
             return TradeResult(
@@ -226,7 +401,7 @@ class AutoTrader:
         
         # Semi 모드
         if self.mode == "semi":
-            logger.info(f"🔔 Semi-auto [{signal.strategy_type}]: {symbol} {signal.action}")
+            logger.info("🔔 Semi-auto [{}]: {} {}", signal.strategy_type, symbol, signal.action)
             return TradeResult(
                 success=True, action=f"SIGNAL_{signal.action}", symbol=symbol,
                 order=None, signal=signal, price=current_price,
@@ -234,10 +409,9 @@ class AutoTrader:
             )
         
         # Full 모드
-        if signal.action == "BUY":
-            return await self._execute_buy(symbol, signal, amount, current_price)
-        elif signal.action == "SELL":
-            return await self._execute_sell(symbol, signal, current_price)
+        handler = self._handlers.get(signal.action)
+        if handler is not None:
+            return await handler(symbol, signal, amount, current_price)
         
         return TradeResult(
             success=False, action=signal.action, symbol=symbol,
@@ -247,19 +421,24 @@ class AutoTrader:
     
     async def _execute_buy(self, symbol: str, signal: HybridSignal, amount: float, current_price: float) -> TradeResult:
         """매수 실행"""
-        logger.info(f"🟢 [{signal.strategy_type}] 매수: {symbol}, ₩{amount:,.0f}")
+        logger.info("🟢 [{}] 매수: {}, ₩{:,.0f}", signal.strategy_type, symbol, amount)
         
-        order = self.upbit.buy_market_order(symbol, amount)
+        order = await asyncio.to_thread(self.upbit.buy_market_order, symbol, amount)
         
         if order.success:
-            volume = amount / current_price
+            # 실제 체결값 우선, 스트림 미수신 시 주문 전 현재가로 추정
+            fill = await self.order_stream.wait_fill(order.uuid, self.FILL_TIMEOUT)
+            if fill is not None:
+                current_price, volume = fill
+            else:
+                volume = amount / current_price
+            self._last_prices.pop(symbol, None)  # 체결 후에는 새 현재가 사용
             
             self.positions[symbol] = PositionInfo(
-                in_position=True,
                 entry_price=current_price,
                 balance=volume,
                 strategy_type=signal.strategy_type,
-                entry_time=datetime.now()
+                entry_time=time.monotonic()
             )
             
             await self.notifier.send_buy_alert(
@@ -279,27 +458,32 @@ class AutoTrader:
                 amount=amount, volume=None, strategy_type=signal.strategy_type, error=order.error
             )
     
-    async def _execute_sell(self, symbol: str, signal: HybridSignal, current_price: float) -> TradeResult:
-        """매도 실행"""
-        ticker = symbol.split('-')[1]
-        balance = self.upbit.get_balance(ticker)
+    async def _execute_sell(self, symbol: str, signal: HybridSignal, amount: float, current_price: float) -> TradeResult:
+        """매도 실행 (보유 수량 전량 매도 - amount는 _execute_buy와 호출 형식을 맞추기 위한 인자)"""
+        ticker = self._base_ccy.get(symbol)
+        if ticker is None:
+            # 대상 외 심볼 (직접 호출) - 다음 매도부터 재사용하도록 등록
+            ticker = self._base_ccy[symbol] = symbol.partition('-')[2]
+        balance, avg_buy_price = await asyncio.to_thread(self.upbit.get_account, ticker, self.check_interval)
         
         if balance <= 0:
-            self.positions[symbol] = PositionInfo(
-                in_position=False, entry_price=0.0, balance=0.0, strategy_type="NONE"
-            )
+            self._clear_position(symbol)
             return TradeResult(
                 success=False, action="SELL", symbol=symbol,
                 order=None, signal=signal, price=current_price,
                 amount=None, volume=0, strategy_type=signal.strategy_type, error="매도 가능 수량 없음"
             )
         
-        avg_buy_price = self.upbit.get_avg_buy_price(ticker)
-        logger.info(f"🔴 [{signal.strategy_type}] 매도: {symbol}, {balance:.8f}")
+        logger.info("🔴 [{}] 매도: {}, {:.8f}", signal.strategy_type, symbol, balance)
         
-        order = self.upbit.sell_market_order(symbol, balance)
+        order = await asyncio.to_thread(self.upbit.sell_market_order, symbol, balance)
         
         if order.success:
+            # 실제 체결값 우선, 스트림 미수신 시 주문 전 현재가로 추정
+            fill = await self.order_stream.wait_fill(order.uuid, self.FILL_TIMEOUT)
+            if fill is not None:
+                current_price, balance = fill
+            self._last_prices.pop(symbol, None)  # 체결 후에는 새 현재가 사용
             total = balance * current_price
             profit = total - (balance * avg_buy_price) if avg_buy_price > 0 else 0
             profit_rate = ((current_price - avg_buy_price) / avg_buy_price * 100) if avg_buy_price > 0 else 0
@@ -307,9 +491,7 @@ class AutoTrader:
             # 전략에 수익률 업데이트
             self.strategy.update_profit(profit_rate)
             
-            self.positions[symbol] = PositionInfo(
-                in_position=False, entry_price=0.0, balance=0.0, strategy_type="NONE"
-            )
+            self._clear_position(symbol)
             
             self.risk_manager.record_trade(amount=total, profit=profit, strategy=f"Hybrid_{signal.strategy_type}")
             
@@ -335,51 +517,90 @@ class AutoTrader:
         """1회 분석 및 거래"""
         results = []
         
-        await self._sync_positions()
+        # 시장 지표(BTC) 캔들은 가격/포지션 동기화와 동시에 조회 시작
+        btc_fetch = asyncio.ensure_future(
+            asyncio.to_thread(self.upbit.get_ohlcv, "KRW-BTC", interval="minute60", count=100)
+        )
+        
+        # 반복문에서 쓰는 속성/판정은 지역 변수로 1회만 조회
+        stream_price = self.market_stream.get_price
+        last_prices = self._last_prices
+        symbols = self._active_symbols
+        
+        try:
+            # 스트림 가격이 없는 심볼은 현재가를 한 번에 조회 (심볼별 REST 호출 대신)
+            # 조회값은 가격 캐시에도 기록해 포지션 동기화가 재사용
+            missing = [symbol for symbol in symbols if stream_price(symbol) is None]
+            prices = await asyncio.to_thread(self.upbit.get_current_prices, missing) if missing else {}
+            now = time.monotonic()
+            for symbol, price in prices.items():
+                last_prices[symbol] = (price, now)
+            
+            await self._sync_positions()
+        except BaseException:
+            # BTC 캔들 조회 태스크가 대기자 없이 남지 않도록 취소 (취소/예외 모두)
+            btc_fetch.cancel()
+            raise
         
         # 🚀 시장 상태 확인 (일론 머스크 원칙: 하락장에선 거래 중단)
         market_state = None
         try:
             # BTC를 시장 지표로 사용 (가장 대표적)
-            btc_df = self.upbit.get_ohlcv("KRW-BTC", interval="minute60", count=100)
+            btc_df = await btc_fetch
             if btc_df is not None:
                 market_state = self.market_analyzer.analyze(btc_df)
                 if market_state:
                     if market_state.is_bearish():
-                        logger.warning(f"📉 하락장 감지 - 매수 중단 (RSI: {market_state.rsi:.1f}, 추세: {market_state.trend.value})")
+                        logger.warning("📉 하락장 감지 - 매수 중단 (RSI: {:.1f}, 추세: {})", market_state.rsi, market_state.trend.value)
                     elif market_state.is_bullish():
-                        logger.info(f"📈 상승장 감지 (RSI: {market_state.rsi:.1f}, 추세: {market_state.trend.value})")
+                        logger.info("📈 상승장 감지 (RSI: {:.1f}, 추세: {})", market_state.rsi, market_state.trend.value)
                     else:
-                        logger.info(f"➡️ 횡보장 감지 (RSI: {market_state.rsi:.1f}, 추세: {market_state.trend.value})")
+                        logger.info("➡️ 횡보장 감지 (RSI: {:.1f}, 추세: {})", market_state.rsi, market_state.trend.value)
         except Exception as e:
             logger.warning(f"시장 분석 실패 (계속 진행): {e}")
         
         # 일일 목표 체크
         stats = self.strategy.get_daily_stats()
         if stats["target_achieved"]:
-            logger.info(f"🎉 일일 목표 달성! ({stats['daily_profit']:.2f}%)")
+            logger.info("🎉 일일 목표 달성! ({:.2f}%)", stats['daily_profit'])
         
-        logger.info(f"📊 하이브리드 분석: {', '.join(self.target_symbols)} | 일일 수익: {stats['daily_profit']:.2f}%")
+        logger.opt(lazy=True).info(
+            "📊 하이브리드 분석: {} | 일일 수익: {:.2f}%",
+            lambda: ', '.join(self.target_symbols), lambda: stats['daily_profit']
+        )
+        
+        block_buys = market_state is not None and market_state.is_bearish()
+        
+        # 심볼별 분석(캔들 조회)은 동시에 실행, 주문은 잔고/리스크 일관성을 위해 순서대로 처리
+        # (각 매수가 앞선 주문의 잔고 변화와 일일 거래 기록을 보고 판단)
+        semaphore = asyncio.Semaphore(self.ANALYZE_CONCURRENCY)
         
-        for symbol in self.target_symbols:
+        async def analyze_bounded(symbol: str) -> Optional[HybridSignal]:
+            async with semaphore:
+                return await self.analyze(symbol, prices.get(symbol))
+        
+        signals = await asyncio.gather(
+            *(analyze_bounded(symbol) for symbol in symbols),
+            return_exceptions=True
+        )
+        
+        for symbol, signal in zip(symbols, signals):
             try:
-                if symbol == "KRW-BTC":
-                    continue
-                
-                if symbol in settings.exclude_symbols:
-                    continue
+                if isinstance(signal, Exception):
+                    raise signal
                 
-                signal = self.analyze(symbol)
                 if signal is None:
                     continue
                 
                 # 🚀 하락장에서 매수 신호 무시 (손절/익절은 유지)
-                if signal.action == "BUY" and market_state and market_state.is_bearish():
-                    logger.info(f"⛔ {symbol} 매수 신호 무시 (하락장)")
+                action = signal.action
+                if action == "BUY" and block_buys:
+                    logger.info("⛔ {} 매수 신호 무시 (하락장)", symbol)
                     continue
                 
-                if signal.action != "HOLD":
-                    result = await self.execute_signal(symbol, signal)
+                if action != "HOLD":
+                    cached = last_prices.get(symbol)
+                    result = await self.execute_signal(symbol, signal, cached[0] if cached else None)
                     results.append(result)
                     
             except Exception as e:
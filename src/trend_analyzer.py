@@ -3,13 +3,16 @@ CryptoBot Studio - Trend Following Analyzer
 RSI + EMA 기반 추세 추종 스캘핑 전략
 5분봉 고빈도 거래로 일일 목표 달성 보조
 """
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, Any
+from typing import Any, ClassVar, Dict, Optional, Tuple
 from dataclasses import dataclass
 from loguru import logger
 
+from kernels import rsi_ema_tail, rsi_series, trend_signal_series
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TrendSignal:
     """추세 추종 신호"""
     action: str  # "BUY", "SELL", "HOLD"
@@ -20,8 +23,10 @@ class TrendSignal:
     ema_slow: float
     entry_price: float
     
+    _EMOJI: ClassVar[Dict[str, str]] = {"BUY": "🟢", "SELL": "🔴", "HOLD": "⏸️"}
+    
     def __str__(self):
-        emoji = "🟢" if self.action == "BUY" else "🔴" if self.action == "SELL" else "⏸️"
+        emoji = self._EMOJI.get(self.action, "⏸️")
         return f"{emoji} TREND {self.action}: RSI={self.rsi:.1f}, EMA Fast={'>' if self.ema_fast > self.ema_slow else '<'}Slow [{self.confidence:.0%}]"
 
 
@@ -57,20 +62,50 @@ class TrendFollowingAnalyzer:
         self.rsi_overbought = rsi_overbought
         self.take_profit = take_profit
         self.stop_loss = stop_loss
+        
+        # EMA 평활 계수 (pandas ewm span과 동일: 2 / (span + 1))
+        self._alpha_fast = 2.0 / (ema_fast + 1)
+        self._alpha_slow = 2.0 / (ema_slow + 1)
     
     def calculate_rsi(self, df: pd.DataFrame, period: int = 14) -> pd.Series:
-        """RSI 계산"""
-        delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        """RSI 계산 (analyze와 같은 단순 평균 방식, 단일 패스 커널)"""
+        close = df['close'].to_numpy(dtype=np.float64)
+        return pd.Series(rsi_series(close, period), index=df.index)
     
     def calculate_ema(self, df: pd.DataFrame, period: int) -> pd.Series:
         """EMA 계산"""
         return df['close'].ewm(span=period, adjust=False).mean()
     
+    def _calculate_indicators(self, close: np.ndarray) -> tuple:
+        """
+        RSI/EMA 계산 (마지막 두 봉 값)
+        
+        EMA는 매 호출마다 주어진 창의 첫 봉으로 시드해 다시 계산합니다.
+        
+        Returns:
+            (rsi, ema_fast, ema_fast_prev, ema_slow, ema_slow_prev)
+        """
+        return rsi_ema_tail(close, self.rsi_period, self._alpha_fast, self._alpha_slow)
+    
+    def analyze_vectorized(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        전체 봉 신호 일괄 계산 (백테스트용)
+        
+        봉 i의 결과는 df.iloc[:i+1]로 analyze(in_position=False)를 호출한 것과
+        같은 진입 판단입니다. SELL(-1)은 보유 중일 때의 청산 조건이며
+        익절/손절은 경로 의존적이므로 포함하지 않습니다.
+        
+        Returns:
+            (actions: int8 배열 BUY=1/SELL=-1/HOLD=0, confidences: float32 배열)
+        """
+        close = df['close'].to_numpy(dtype=np.float64)
+        min_length = max(self.rsi_period, self.ema_slow_period) + 5
+        
+        return trend_signal_series(
+            close, self.rsi_period, self._alpha_fast, self._alpha_slow,
+            self.rsi_oversold, self.rsi_overbought, min_length
+        )
+    
     def analyze(
         self,
         df: pd.DataFrame,
@@ -103,13 +138,11 @@ class TrendFollowingAnalyzer:
                 entry_price=0
             )
         
-        # 지표 계산 (원본 DataFrame에 컬럼 추가 - copy 불필요)
-        df['rsi'] = self.calculate_rsi(df, self.rsi_period)
-        df['ema_fast'] = self.calculate_ema(df, self.ema_fast_period)
-        df['ema_slow'] = self.calculate_ema(df, self.ema_slow_period)
+        # 지표 계산 (RSI + EMA 단일 패스, 마지막 두 봉 값만 추출)
+        close = df['close'].to_numpy(dtype=np.float64)
+        current_rsi, ema_fast, prev_ema_fast, ema_slow, prev_ema_slow = self._calculate_indicators(close)
         
-        current_price = current_price or df['close'].iloc[-1]
-        current_rsi = df['rsi'].iloc[-1]
+        current_price = current_price or close[-1]
         
         # NaN 체크 (데이터 부족 시)
         if pd.isna(current_rsi):
@@ -123,13 +156,6 @@ class TrendFollowingAnalyzer:
                 entry_price=0
             )
         
-        ema_fast = df['ema_fast'].iloc[-1]
-        ema_slow = df['ema_slow'].iloc[-1]
-        
-        # 이전 값 (크로스 확인용)
-        prev_ema_fast = df['ema_fast'].iloc[-2]
-        prev_ema_slow = df['ema_slow'].iloc[-2]
-        
         # 포지션 보유 중 - 익절/손절 판단
         if in_position and entry_price and entry_price > 0:
             profit_rate = ((current_price - entry_price) / entry_price) * 100
@@ -164,7 +190,7 @@ class TrendFollowingAnalyzer:
             confidence = 0.7 + (50 - current_rsi) / 100  # RSI 낮을수록 높은 신뢰도
             return TrendSignal(
                 action="BUY",
-                confidence=min(0.9, confidence),
+                confidence=0.9 if confidence > 0.9 else confidence,
                 reason=f"{'골든크로스' if golden_cross else 'EMA 정배열'} + RSI {current_rsi:.1f}",
                 rsi=current_rsi,
                 ema_fast=ema_fast,
@@ -2,16 +2,63 @@
 CryptoBot Studio - Upbit Exchange Client
 Handles all interactions with Upbit API
 """
+import asyncio
+import heapq
+import json
+import time
+import uuid as uuid_lib
+import aiohttp
 import pyupbit
-from typing import Optional, Dict, List, Any
+import pyupbit.request_api
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, List, Any, Tuple, Callable
 from dataclasses import dataclass
 from datetime import datetime
 from loguru import logger
 
 from config import settings
+from cache import get_ohlcv_cache, get_rate_limiter
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson 미설치 - 표준 json으로 동작
+    orjson = None
+    _json_loads = json.loads
 
-@dataclass
+
+# pyupbit는 호출마다 requests.get/post(새 연결 + TLS 핸드셰이크)를 사용하므로
+# keep-alive 연결 풀을 가진 공유 세션으로 교체 (시세/주문 요청이 연결 재사용)
+_HTTP_SESSION = requests.Session()
+# 풀 크기는 AutoTrader 동시 분석(최대 8심볼 x 캔들 2종)보다 크게 - 넘치면 연결을 버리고 새로 맺음
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+pyupbit.request_api.requests = _HTTP_SESSION
+
+
+def _use_fast_json(resp, *args, **kwargs):
+    """응답 훅: pyupbit가 호출하는 resp.json()을 orjson 디코더로 교체 (호가/시세 파싱 비용 절감)"""
+    resp.json = lambda **_: _json_loads(resp.content)
+    return resp
+
+
+if orjson is not None:
+    _HTTP_SESSION.hooks["response"].append(_use_fast_json)
+
+
+def _orderbook_summary(ob: Dict) -> Dict:
+    """Upbit 호가 응답/스트림 메시지 -> 잔량 합계 + 매수/매도 비율 + 호가 단위"""
+    total_ask = ob.get('total_ask_size', 0)
+    total_bid = ob.get('total_bid_size', 0)
+    return {
+        'total_ask_size': total_ask,
+        'total_bid_size': total_bid,
+        'bid_ask_ratio': total_bid / total_ask if total_ask > 0 else 0,  # 0으로 나누기 방지
+        'orderbook_units': ob.get('orderbook_units', [])
+    }
+
+
+@dataclass(slots=True, frozen=True)
 class OrderResult:
     """주문 결과"""
     success: bool
@@ -51,6 +98,8 @@ class UpbitClient:
     - OHLCV 캔들 데이터 조회
     """
     
+    CONNECTED_MAX_AGE = 15.0  # 최근 인증 호출 성공을 연결 상태로 인정하는 한도 (초)
+    
     def __init__(
         self,
         access_key: Optional[str] = None,
@@ -66,16 +115,26 @@ class UpbitClient:
         except Exception as e:
             logger.error(f"❌ Upbit 클라이언트 초기화 실패: {e}")
             self.upbit = None
+        
+        # 계좌 조회 캐시 (/v1/accounts 응답, 조회 시각) - 주문 성공 시 무효화
+        self._accounts: Dict[str, Dict] = {}  # 통화 -> 계좌 항목
+        self._accounts_ts = 0.0
+        
+        # 마지막 인증 API 호출 성공 시각 (is_connected가 별도 조회 없이 판단)
+        self._last_ok_ts = 0.0
+        
+        # 거래대금 상위 종목 캐시 ((limit, 제외 목록), 결과, 조회 시각) - KRW 전 종목 티커 조회가 무거움
+        self._top_volume: Optional[Tuple[Tuple, List[str], float]] = None
     
     def is_connected(self) -> bool:
-        """API 연결 상태 확인"""
+        """API 연결 상태 확인 (최근 인증 호출이 성공했으면 조회 생략)"""
         if not self.upbit:
             return False
-        try:
-            balance = self.upbit.get_balance("KRW")
-            return balance is not None
-        except Exception:
-            return False
+        if time.monotonic() - self._last_ok_ts < self.CONNECTED_MAX_AGE:
+            return True
+        # 확인용 조회도 계좌 캐시를 갱신하도록 전체 잔고로 조회
+        self.get_balances()
+        return time.monotonic() - self._last_ok_ts < self.CONNECTED_MAX_AGE
     
     def get_balance(self, ticker: str = "KRW") -> float:
         """
@@ -109,21 +168,63 @@ class UpbitClient:
             return []
         
         try:
-            return self.upbit.get_balances()
+            balances = self.upbit.get_balances()
+            if isinstance(balances, list):
+                self._accounts = {item.get('currency'): item for item in balances}
+                self._accounts_ts = self._last_ok_ts = time.monotonic()
+            else:
+                # 조회 실패 - 이전 계좌 응답은 유지하고 다음 get_account에서 재조회
+                self._accounts_ts = 0.0
+            return balances
         except Exception as e:
             logger.error(f"전체 잔고 조회 실패: {e}")
+            self._accounts_ts = 0.0
             return []
     
-    def get_top_volume_tickers(self, limit: int = 10) -> List[str]:
+    def get_account(self, ticker: str = "KRW", max_age: float = 1.0) -> Tuple[float, float]:
+        """
+        통화별 잔고 + 평균 매수가 조회 (/v1/accounts 1회 응답에서 함께 추출)
+        
+        Args:
+            ticker: 통화 (예: "KRW", "BTC")
+            max_age: 캐시된 계좌 응답 재사용 한도 (초)
+            
+        Returns:
+            (잔고, 평균 매수가) - 없으면 (0.0, 0.0)
+        """
+        if time.monotonic() - self._accounts_ts > max_age:
+            self.get_balances()
+        
+        item = self._accounts.get(ticker)
+        if item is None:
+            return 0.0, 0.0
+        return (
+            float(item.get('balance', 0) or 0),
+            float(item.get('avg_buy_price', 0) or 0)
+        )
+    
+    def get_top_volume_tickers(
+        self,
+        limit: int = 10,
+        exclude: frozenset = frozenset(),
+        max_age: float = 60.0
+    ) -> List[str]:
         """
         24시간 거래대금 상위 종목 조회 (KRW 마켓만)
         
         Args:
             limit: 상위 몇 개를 가져올지 (기본 10개)
+            exclude: 제외할 심볼 (조회 전에 빼므로 결과는 제외 후 상위 limit개)
+            max_age: 같은 조건의 이전 결과 재사용 한도 (초, 순위는 천천히 바뀜)
             
         Returns:
             거래대금 상위 종목 리스트 (예: ["KRW-BTC", "KRW-XRP", ...])
         """
+        key = (limit, frozenset(exclude))
+        cached = self._top_volume
+        if cached is not None and cached[0] == key and time.monotonic() - cached[2] <= max_age:
+            return list(cached[1])
+        
         try:
             # KRW 마켓 전체 티커 조회
             tickers = pyupbit.get_tickers(fiat="KRW")
@@ -131,6 +232,9 @@ class UpbitClient:
                 logger.error("KRW 마켓 티커 조회 실패")
                 return []
             
+            if exclude:
+                tickers = [t for t in tickers if t not in exclude]
+            
             # 각 티커의 24시간 거래대금 조회
             ticker_data = pyupbit.get_current_price(tickers, verbose=True)
             
@@ -142,24 +246,47 @@ class UpbitClient:
             if isinstance(ticker_data, dict):
                 ticker_data = [ticker_data]
             
-            # 거래대금 기준 정렬 (acc_trade_price_24h)
-            sorted_tickers = sorted(
+            # 거래대금 기준 상위 N개 (acc_trade_price_24h, 전체 정렬 없이 선택)
+            top_tickers = heapq.nlargest(
+                limit,
                 ticker_data,
-                key=lambda x: float(x.get('acc_trade_price_24h', 0) or 0),
-                reverse=True
+                key=lambda x: float(x.get('acc_trade_price_24h', 0) or 0)
             )
-            
-            # 상위 N개 심볼 추출
-            top_symbols = [t['market'] for t in sorted_tickers[:limit]]
+            top_symbols = [t['market'] for t in top_tickers]
             
             logger.info(f"📊 거래대금 상위 {limit}개: {', '.join(top_symbols)}")
-            return top_symbols
+            self._top_volume = (key, top_symbols, time.monotonic())
+            return list(top_symbols)
             
         except Exception as e:
             logger.error(f"거래대금 상위 종목 조회 실패: {e}")
             return []
 
     
+    def auth_headers(self) -> Dict[str, str]:
+        """인증 헤더 (private WebSocket 연결용 JWT, 클라이언트 미초기화 시 빈 딕셔너리)"""
+        if not self.upbit:
+            return {}
+        return self.upbit._request_headers()
+    
+    def keep_alive(self) -> bool:
+        """
+        공유 세션 연결 유지용 경량 요청 (유휴 연결 종료 방지)
+        
+        Returns:
+            성공 여부
+        """
+        try:
+            resp = _HTTP_SESSION.get(
+                "https://api.upbit.com/v1/ticker",
+                params={"markets": settings.trade_symbol},
+                timeout=5
+            )
+            return resp.ok
+        except Exception as e:
+            logger.debug("연결 유지 요청 실패: {}", e)
+            return False
+    
     def get_current_price(self, symbol: str = None) -> Optional[float]:
         """
         현재가 조회
@@ -179,6 +306,29 @@ class UpbitClient:
             logger.error(f"현재가 조회 실패 ({symbol}): {e}")
             return None
     
+    def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        여러 마켓 현재가 일괄 조회 (/v1/ticker 한 번 호출)
+        
+        Args:
+            symbols: 마켓 심볼 리스트
+            
+        Returns:
+            심볼 -> 현재가 (실패 시 빈 딕셔너리)
+        """
+        if not symbols:
+            return {}
+        
+        try:
+            prices = pyupbit.get_current_price(list(symbols))
+            if not isinstance(prices, dict):
+                # 심볼이 하나면 pyupbit가 float를 반환
+                return {symbols[0]: float(prices)} if prices else {}
+            return {symbol: float(price) for symbol, price in prices.items() if price}
+        except Exception as e:
+            logger.error(f"현재가 일괄 조회 실패: {e}")
+            return {}
+    
     def get_ticker(self, symbol: str = None) -> Optional[Dict]:
         """
         티커 정보 조회 (현재가, 거래량 등)
@@ -206,7 +356,9 @@ class UpbitClient:
         interval: str = "minute60",
         count: int = 200,
         use_cache: bool = True,
-        cache_ttl: float = 60.0
+        cache_ttl: float = 60.0,
+        bar_aligned: bool = False,
+        live_price: Optional[float] = None
     ) -> Optional[Any]:
         """
         OHLCV 캔들 데이터 조회 (캐시 지원)
@@ -220,18 +372,21 @@ class UpbitClient:
             count: 조회할 캔들 개수 (최대 200)
             use_cache: 캐시 사용 여부 (기본 True)
             cache_ttl: 캐시 유효 시간 (초, 기본 60초)
+            bar_aligned: 마지막 봉이 닫힐 때까지 캐시 유지 (새 봉이 생길 때만 재조회)
+            live_price: 현재가 (bar_aligned 캐시의 진행 중인 봉 종가/고가/저가에 반영)
             
         Returns:
             pandas DataFrame (open, high, low, close, volume)
         """
-        from cache import get_ohlcv_cache, get_rate_limiter
-        
         symbol = symbol or settings.trade_symbol
         
         try:
             if use_cache:
                 cache = get_ohlcv_cache(ttl=cache_ttl)
-                df = cache.get(symbol, interval, count, ttl=cache_ttl)
+                df = cache.get(
+                    symbol, interval, count, ttl=cache_ttl,
+                    bar_aligned=bar_aligned, live_price=live_price
+                )
             else:
                 # Rate limiting for direct API calls
                 limiter = get_rate_limiter(settings.api_calls_per_second)
@@ -239,7 +394,7 @@ class UpbitClient:
                 df = pyupbit.get_ohlcv(symbol, interval=interval, count=count)
             
             if df is not None and len(df) > 0:
-                logger.debug(f"OHLCV 조회 성공: {symbol} ({len(df)}개)")
+                logger.debug("OHLCV 조회 성공: {} ({}개)", symbol, len(df))
                 return df
             return None
         except Exception as e:
@@ -284,6 +439,8 @@ class UpbitClient:
             
             if result and 'uuid' in result:
                 logger.success(f"✅ 지정가 매수 주문 완료: {result['uuid']}")
+                self._accounts_ts = 0.0  # 잔고 변경 - 계좌 캐시 무효화
+                self._last_ok_ts = time.monotonic()
                 return OrderResult(
                     success=True,
                     uuid=result.get('uuid'),
@@ -349,6 +506,8 @@ class UpbitClient:
             
             if result and 'uuid' in result:
                 logger.success(f"✅ 매수 주문 성공: {result['uuid']}")
+                self._accounts_ts = 0.0  # 잔고 변경 - 계좌 캐시 무효화
+                self._last_ok_ts = time.monotonic()
                 
                 return OrderResult(
                     success=True,
@@ -450,6 +609,8 @@ class UpbitClient:
             
             if result and 'uuid' in result:
                 logger.success(f"✅ 매도 주문 성공: {result['uuid']}")
+                self._accounts_ts = 0.0  # 잔고 변경 - 계좌 캐시 무효화
+                self._last_ok_ts = time.monotonic()
                 
                 return OrderResult(
                     success=True,
@@ -530,26 +691,45 @@ class UpbitClient:
                 return None
             
             # 데이터 파싱
-            total_ask = ob.get('total_ask_size', 0)
-            total_bid = ob.get('total_bid_size', 0)
-            
-            # 매수/매도 비율 계산 (0으로 나누기 방지)
-            bid_ask_ratio = total_bid / total_ask if total_ask > 0 else 0
-            
-            result = {
-                'total_ask_size': total_ask,
-                'total_bid_size': total_bid,
-                'bid_ask_ratio': bid_ask_ratio,
-                'orderbook_units': ob.get('orderbook_units', [])
-            }
+            result = _orderbook_summary(ob)
             
-            logger.debug(f"오더북 조회: 매수잔량={total_bid:.2f}, 매도잔량={total_ask:.2f}, 비율={bid_ask_ratio:.2f}x")
+            logger.debug(
+                "오더북 조회: 매수잔량={:.2f}, 매도잔량={:.2f}, 비율={:.2f}x",
+                result['total_bid_size'], result['total_ask_size'], result['bid_ask_ratio']
+            )
             return result
 
         except Exception as e:
             logger.error(f"오더북 조회 실패 ({symbol}): {e}")
             return None
     
+    def get_orderbooks(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        여러 마켓 호가창 일괄 조회 (/v1/orderbook 한 번 호출)
+        
+        Args:
+            symbols: 마켓 심볼 리스트
+            
+        Returns:
+            심볼 -> get_orderbook과 같은 형식의 호가 (실패 시 빈 딕셔너리)
+        """
+        if not symbols:
+            return {}
+        
+        try:
+            orderbooks = pyupbit.get_orderbook(list(symbols))
+            if isinstance(orderbooks, dict):
+                if 'error' in orderbooks:
+                    logger.error(f"오더북 일괄 조회 API 에러: {orderbooks.get('error')}")
+                    return {}
+                orderbooks = [orderbooks]
+            if not isinstance(orderbooks, list):
+                return {}
+            return {ob['market']: _orderbook_summary(ob) for ob in orderbooks if 'market' in ob}
+        except Exception as e:
+            logger.error(f"오더북 일괄 조회 실패: {e}")
+            return {}
+    
     def get_order(self, uuid: str) -> Optional[Dict]:
         """
         주문 조회
@@ -589,6 +769,233 @@ class UpbitClient:
             return 0.0
 
 
+class UpbitMarketStream:
+    """
+    Upbit WebSocket 시세 스트림 (현재가 + 호가)
+    
+    연결 하나로 ticker/orderbook 채널을 함께 구독하고 마지막 값을 메모리에
+    보관합니다. 분석 루프는 REST 호출 대신 get_price/get_orderbook으로
+    즉시 읽고, 값이 없거나 오래되면 None을 받아 REST로 대체합니다.
+    """
+    
+    WS_URL = "wss://api.upbit.com/websocket/v1"
+    MAX_AGE = 5.0  # 스트림 값 유효 시간 (초)
+    RECONNECT_DELAY = 1.0  # 재연결 대기 시작값 (초, 실패 시 2배씩 최대 30초)
+    
+    def __init__(self, symbols: List[str]):
+        self.symbols = list(symbols)
+        self._prices: Dict[str, Tuple[float, float]] = {}  # symbol -> (현재가, 수신 시각)
+        self._orderbooks: Dict[str, Tuple[Dict, float]] = {}  # symbol -> (호가, 수신 시각)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def start(self):
+        """백그라운드 수신 태스크 시작"""
+        if self._task is None and self.symbols:
+            self._session = aiohttp.ClientSession()
+            self._task = asyncio.create_task(self._run())
+    
+    async def close(self):
+        """수신 태스크 및 연결 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def get_price(self, symbol: str) -> Optional[float]:
+        """
+        스트림 현재가
+        
+        체결가(ticker)가 MAX_AGE 이내면 체결가, 아니면 최신 호가의 최우선 매수/매도 중간값.
+        둘 다 없거나 오래되면 None.
+        """
+        now = time.monotonic()
+        cached = self._prices.get(symbol)
+        if cached is not None and now - cached[1] <= self.MAX_AGE:
+            return cached[0]
+        
+        book = self._orderbooks.get(symbol)
+        if book is not None and now - book[1] <= self.MAX_AGE:
+            units = book[0]['orderbook_units']
+            if units:
+                return (units[0]['bid_price'] + units[0]['ask_price']) / 2
+        return None
+    
+    def get_orderbook(self, symbol: str) -> Optional[Dict]:
+        """스트림 호가 (UpbitClient.get_orderbook과 같은 형식, 없거나 오래되면 None)"""
+        cached = self._orderbooks.get(symbol)
+        if cached is None or time.monotonic() - cached[1] > self.MAX_AGE:
+            return None
+        return cached[0]
+    
+    async def _run(self):
+        """연결 유지 루프 (끊기면 지수 백오프로 재연결)"""
+        delay = self.RECONNECT_DELAY
+        request = json.dumps([
+            {"ticket": str(uuid_lib.uuid4())},
+            {"type": "ticker", "codes": self.symbols},
+            {"type": "orderbook", "codes": self.symbols},
+        ])
+        
+        while True:
+            try:
+                async with self._session.ws_connect(self.WS_URL, heartbeat=60) as ws:
+                    await ws.send_str(request)
+                    logger.info(f"📡 시세 스트림 연결: {', '.join(self.symbols)}")
+                    delay = self.RECONNECT_DELAY
+                    
+                    async for msg in ws:
+                        if msg.type in (aiohttp.WSMsgType.BINARY, aiohttp.WSMsgType.TEXT):
+                            self._on_message(_json_loads(msg.data))
+                        elif msg.type == aiohttp.WSMsgType.ERROR:
+                            break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"시세 스트림 오류: {e}")
+            
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+    
+    def _on_message(self, data: Dict):
+        """수신 메시지 반영"""
+        symbol = data.get("code")
+        now = time.monotonic()
+        
+        if data.get("type") == "ticker":
+            price = data.get("trade_price")
+            if price:
+                self._prices[symbol] = (float(price), now)
+        elif data.get("type") == "orderbook":
+            self._orderbooks[symbol] = (_orderbook_summary(data), now)
+
+
+class UpbitOrderStream:
+    """
+    Upbit private WebSocket 내 주문 스트림 (myOrder)
+    
+    주문이 완료(done/cancel)되면 실제 평균 체결가와 체결 수량을 보관합니다.
+    주문 직후 wait_fill로 체결 메시지를 기다려 추정가 대신 실제 체결값을
+    사용하고, 시간 안에 오지 않으면 None을 받아 추정값으로 대체합니다.
+    """
+    
+    WS_URL = "wss://api.upbit.com/websocket/v1/private"
+    RECONNECT_DELAY = 1.0  # 재연결 대기 시작값 (초, 실패 시 2배씩 최대 30초)
+    MAX_FILLS = 100  # 대기자 없이 도착한 체결 보관 개수
+    _DONE_STATES = frozenset(("done", "cancel"))
+    
+    def __init__(self, auth_headers: Callable[[], Dict[str, str]]):
+        self._auth_headers = auth_headers
+        self._fills: Dict[str, Tuple[float, float]] = {}  # uuid -> (평균 체결가, 체결 수량)
+        self._waiters: Dict[str, asyncio.Future] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def start(self):
+        """백그라운드 수신 태스크 시작 (인증 정보가 없으면 시작하지 않음)"""
+        if self._task is None and self._auth_headers():
+            self._session = aiohttp.ClientSession()
+            self._task = asyncio.create_task(self._run())
+    
+    async def close(self):
+        """수신 태스크 및 연결 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def wait_fill(self, uuid: str, timeout: float = 2.0) -> Optional[Tuple[float, float]]:
+        """
+        주문 체결 대기
+        
+        Args:
+            uuid: 주문 UUID
+            timeout: 최대 대기 시간 (초)
+            
+        Returns:
+            (평균 체결가, 체결 수량) - 스트림 미연결/시간 초과 시 None
+        """
+        if self._task is None or not uuid:
+            return None
+        
+        fill = self._fills.pop(uuid, None)
+        if fill is not None:
+            return fill
+        
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[uuid] = future
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            logger.debug("체결 대기 시간 초과: {}", uuid)
+            return None
+        finally:
+            self._waiters.pop(uuid, None)
+    
+    async def _run(self):
+        """연결 유지 루프 (끊기면 지수 백오프로 재연결, 연결마다 새 JWT)"""
+        delay = self.RECONNECT_DELAY
+        request = json.dumps([
+            {"ticket": str(uuid_lib.uuid4())},
+            {"type": "myOrder"},
+        ])
+        
+        while True:
+            try:
+                async with self._session.ws_connect(
+                    self.WS_URL, headers=self._auth_headers(), heartbeat=60
+                ) as ws:
+                    await ws.send_str(request)
+                    logger.info("📡 주문 스트림 연결")
+                    delay = self.RECONNECT_DELAY
+                    
+                    async for msg in ws:
+                        if msg.type in (aiohttp.WSMsgType.BINARY, aiohttp.WSMsgType.TEXT):
+                            self._on_message(_json_loads(msg.data))
+                        elif msg.type == aiohttp.WSMsgType.ERROR:
+                            break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"주문 스트림 오류: {e}")
+            
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+    
+    def _on_message(self, data: Dict):
+        """완료된 주문의 체결값 반영"""
+        if data.get("type") != "myOrder" or data.get("state") not in self._DONE_STATES:
+            return
+        
+        executed_volume = float(data.get("executed_volume") or 0)
+        avg_price = float(data.get("avg_price") or 0)
+        if executed_volume <= 0 or avg_price <= 0:
+            return
+        
+        uuid = data.get("uuid")
+        fill = (avg_price, executed_volume)
+        future = self._waiters.get(uuid)
+        if future is not None and not future.done():
+            future.set_result(fill)
+            return
+        
+        self._fills[uuid] = fill
+        if len(self._fills) > self.MAX_FILLS:
+            del self._fills[next(iter(self._fills))]
+
+
 # Test
 if __name__ == "__main__":
     # 테스트 (실제 API 키 없이)